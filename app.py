@@ -7,6 +7,7 @@ import markdown
 from docx import Document
 import io
 import logging
+from collections import deque
 
 # Import all component modules
 from components.business_viability import render_business_viability
@@ -19,6 +20,7 @@ from components.supply_chain import render_supply_chain_analysis
 # Import backend functions
 from backend.ai_integration import generate_ai_response
 from backend.scraper import search_and_extract_content
+from backend.utils import MAX_CHAT_HISTORY
 
 # Import utility modules
 from utils.api_validator import APIKeyValidator
@@ -159,6 +161,26 @@ st.markdown("""
         box-shadow: 0 2px 4px rgba(0,0,0,0.05);
     }
 
+    /* Customer segment profile cards */
+    .segment-share {
+        font-size: 2rem;
+        font-weight: 600;
+        color: var(--primary);
+    }
+    .segment-avatar {
+        background-color: #f0f2f6;
+        border-radius: 50%;
+        width: 100px;
+        height: 100px;
+        display: flex;
+        align-items: center;
+        justify-content: center;
+        margin: 0 auto 1rem;
+        font-size: 24px;
+        color: #0A2540;
+        font-weight: bold;
+    }
+
     /* Improved button styling */
     .stButton > button {
         font-weight: 600 !important;
@@ -169,7 +191,7 @@ st.markdown("""
 
 # Session state initialization
 if 'chat_history' not in st.session_state:
-    st.session_state.chat_history = []
+    st.session_state.chat_history = deque(maxlen=MAX_CHAT_HISTORY)
 if 'research_sources' not in st.session_state:
     st.session_state.research_sources = []
 if 'analysis_results' not in st.session_state:
@@ -393,7 +415,7 @@ if research_button and user_query:
     else:
         with st.spinner(f"Researching '{user_query}' using {ai_model}... This may take a minute or two for comprehensive research."):
             st.session_state.target_audience = target_audience
-            st.session_state.chat_history = []
+            st.session_state.chat_history = deque(maxlen=MAX_CHAT_HISTORY)
             research_prompt = f"Comprehensive research on: {user_query}"
             if target_audience:
                 research_prompt += f" targeting {target_audience}"
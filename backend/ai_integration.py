@@ -4,7 +4,7 @@ import time
 import logging
 import requests
 import re
-from typing import List, Dict, Any, Tuple, Optional
+from typing import List, Dict, Any, Tuple, Optional, Iterator
 
 logger = logging.getLogger(__name__)
 logging.basicConfig(level=logging.INFO)
@@ -12,16 +12,49 @@ logging.basicConfig(level=logging.INFO)
 SYSTEM_PROMPT_TEMPLATE = """You are Research Ninja, an AI-powered content research platform that provides comprehensive market analysis.
 Your task is to analyze the provided information and generate a detailed research report.
 Structure your response in clearly outlined sections with actionable insights and source citations."""
+
+# Error text the generators return or yield in place of (or after part of) a response, so callers can
+# avoid caching it. Only a trailing error matches, optionally followed by the appended Sources section,
+# so an answer that merely quotes one of these phrases is not mistaken for a failure.
+_ERROR_RESPONSE_RE = re.compile(
+    r'(?:Gemini|Cohere) API (?:key missing\. Please set it in settings\.'
+    r'|error: .*?(?:Please verify your (?:GEMINI|COHERE)_API_KEY and (?:its permissions|your network connection)\.'
+    r'|Please try again later\.|Unable to obtain response\.))'
+    r'(?:\n\n## Sources\n.*)?\Z',
+    re.DOTALL
+)
+_DUMMY_ERROR_RESPONSES = frozenset({"Invalid query.", "Error generating dummy response."})
   
-def generate_ai_response(query: str, search_results: List[Dict[str, Any]], model: str = "Gemini") -> Tuple[str, List[Dict[str, Any]]]:
+def format_sources(search_results: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
     """
-    Generate an AI response based on search results.
+    Format search results as numbered source citations.
     """
     formatted_sources = [
         {"id": i + 1, "title": r.get("title", "No Title"), "url": r.get("url", ""), "accessed_date": r.get("accessed_date", "")}
         for i, r in enumerate(search_results)
     ]
     logger.info("Formatted sources: %s", json.dumps(formatted_sources, indent=2))
+    return formatted_sources
+
+def is_error_response(response: str) -> bool:
+    """
+    Return True if a generated response is (or ends with) an error message rather than an answer.
+
+    The error must be the final segment, optionally followed by the appended Sources section.
+    """
+    return response in _DUMMY_ERROR_RESPONSES or _ERROR_RESPONSE_RE.search(response) is not None
+
+def _sources_section(response: str, formatted_sources: List[Dict[str, Any]]) -> str:
+    """Return a Sources section to append when the response cites none of the sources."""
+    if formatted_sources and not any(f"[{i+1}]" in response for i in range(len(formatted_sources))):
+        return "\n\n## Sources\n" + "\n".join(f"{src['id']}. [{src['title']}]({src['url']})" for src in formatted_sources)
+    return ""
+
+def generate_ai_response(query: str, search_results: List[Dict[str, Any]], model: str = "Gemini") -> Tuple[str, List[Dict[str, Any]]]:
+    """
+    Generate an AI response based on search results.
+    """
+    formatted_sources = format_sources(search_results)
     
     valid_results = [r for r in search_results if r.get("content")]
     if not valid_results:
@@ -35,10 +68,37 @@ def generate_ai_response(query: str, search_results: List[Dict[str, Any]], model
     else:
         response = _generate_response_gemini(query, valid_results, formatted_sources)
     
-    if formatted_sources and not any(f"[{i+1}]" in response for i in range(len(formatted_sources))):
-        response += "\n\n## Sources\n" + "\n".join(f"{src['id']}. [{src['title']}]({src['url']})" for src in formatted_sources)
+    response += _sources_section(response, formatted_sources)
     return response, formatted_sources
 
+def generate_ai_response_stream(query: str, search_results: List[Dict[str, Any]], model: str = "Gemini", formatted_sources: Optional[List[Dict[str, Any]]] = None) -> Iterator[str]:
+    """
+    Generate an AI response based on search results, yielding text chunks as they arrive.
+
+    Pass formatted_sources when the caller already has them from format_sources.
+    """
+    if formatted_sources is None:
+        formatted_sources = format_sources(search_results)
+    valid_results = [r for r in search_results if r.get("content")]
+    if not valid_results:
+        logger.warning("No valid content in search results.")
+        yield _generate_dummy_response(query, formatted_sources)
+        return
+
+    if model == "Cohere":
+        chunks = _stream_response_cohere(query, valid_results)
+    else:
+        chunks = _stream_response_gemini(query, valid_results)
+
+    response_parts = []
+    for chunk in chunks:
+        response_parts.append(chunk)
+        yield chunk
+
+    sources_section = _sources_section("".join(response_parts), formatted_sources)
+    if sources_section:
+        yield sources_section
+
 def _prepare_context(categorized_results: Dict[str, List[Dict[str, Any]]]) -> str:
     context = ""
     source_mapping = {}
@@ -82,6 +142,39 @@ def _generate_response_gemini(query: str, search_results: List[Dict[str, Any]],
         logger.error("Gemini API error: %s", str(e))
         return f"Gemini API error: {str(e)}. Please verify your GEMINI_API_KEY and its permissions."
 
+def _stream_response_gemini(query: str, search_results: List[Dict[str, Any]]) -> Iterator[str]:
+    api_key: Optional[str] = os.getenv("GEMINI_API_KEY")
+    if not api_key:
+        logger.warning("Missing Gemini API key.")
+        yield "Gemini API key missing. Please set it in settings."
+        return
+    context = _prepare_context({"gemini": search_results})
+    prompt = f"Research Query: {query}\n\nSources:\n{context}\n\nProvide comprehensive analysis."
+    try:
+        # Server-sent events: each "data:" line carries a partial candidate
+        with requests.post(
+            "https://generativelanguage.googleapis.com/v1/models/gemini-1.5-pro:streamGenerateContent",
+            headers={"Content-Type": "application/json"},
+            params={"key": api_key, "alt": "sse"},
+            json={
+                "contents": [{"parts": [{"text": prompt}]}],
+                "generationConfig": {"temperature": 0.3, "maxOutputTokens": 4000}
+            },
+            timeout=60,
+            stream=True
+        ) as response_post:
+            response_post.raise_for_status()
+            for line in response_post.iter_lines(decode_unicode=True):
+                if not line or not line.startswith("data:"):
+                    continue
+                event = json.loads(line[len("data:"):])
+                for part in event["candidates"][0].get("content", {}).get("parts", []):
+                    if part.get("text"):
+                        yield part["text"]
+    except Exception as e:
+        logger.error("Gemini API error: %s", str(e))
+        yield f"Gemini API error: {str(e)}. Please verify your GEMINI_API_KEY and its permissions."
+
 # Cohere API integration with retry mechanism and increased timeout
 def _generate_response_cohere(query: str, search_results: List[Dict[str, Any]], formatted_sources: List[Dict[str, Any]] = None) -> str:
     api_key: Optional[str] = os.getenv("COHERE_API_KEY")
@@ -112,6 +205,49 @@ def _generate_response_cohere(query: str, search_results: List[Dict[str, Any]],
             return f"Cohere API error: {str(e)}. Please verify your COHERE_API_KEY and your network connection."
     return "Cohere API error: Unable to obtain response."
 
+def _stream_response_cohere(query: str, search_results: List[Dict[str, Any]]) -> Iterator[str]:
+    api_key: Optional[str] = os.getenv("COHERE_API_KEY")
+    if not api_key:
+        logger.warning("Missing Cohere API key.")
+        yield "Cohere API key missing. Please set it in settings."
+        return
+    context = _prepare_context({"cohere": search_results})
+    prompt = f"{SYSTEM_PROMPT_TEMPLATE}\nResearch Query: {query}\n\nSources:\n{context}\n\nProvide analysis with citations."
+    max_retries = 3
+    for attempt in range(1, max_retries + 1):
+        streamed = False
+        try:
+            # The streamed response is newline-delimited JSON, one generation chunk per line
+            with requests.post(
+                "https://api.cohere.ai/v1/generate",
+                headers={"Content-Type": "application/json", "Authorization": f"Bearer {api_key}"},
+                json={"model": "command", "prompt": prompt, "max_tokens": 4000, "temperature": 0.3, "stop_sequences": [], "stream": True},
+                timeout=90,
+                stream=True
+            ) as response_post:
+                response_post.raise_for_status()
+                for line in response_post.iter_lines(decode_unicode=True):
+                    if not line:
+                        continue
+                    event = json.loads(line)
+                    if event.get("is_finished"):
+                        return
+                    if event.get("text"):
+                        streamed = True
+                        yield event["text"]
+            return
+        except requests.exceptions.Timeout as te:
+            logger.warning("Cohere API timeout on attempt %d: %s", attempt, str(te))
+            # Only retry if nothing has been shown yet, otherwise the output would repeat
+            if streamed or attempt == max_retries:
+                yield f"Cohere API error: Read timed out after {attempt} attempts. Please try again later."
+                return
+            time.sleep(2)  # brief pause before retrying
+        except Exception as e:
+            logger.error("Cohere API error on attempt %d: %s", attempt, str(e))
+            yield f"Cohere API error: {str(e)}. Please verify your COHERE_API_KEY and your network connection."
+            return
+
 def _generate_dummy_response(query: str, formatted_sources: List[Dict[str, Any]]) -> str:
     if not isinstance(query, str):
         logger.error("Invalid query.")
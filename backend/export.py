@@ -55,7 +55,8 @@ def export_to_pdf(research_data: Dict[str, Any]) -> str:
             ))
             content.append(Spacer(1, 20))
 
-            # Split the response into lines and format based on header markers
+            # Split the response into lines and format based on header markers.
+            # Vertical spacing comes from each style's spaceAfter, so no per-line Spacer is needed.
             response_text = research_data.get('response', '')
             for line in response_text.split('\n'):
                 stripped_line = line.strip()
@@ -65,7 +66,6 @@ def export_to_pdf(research_data: Dict[str, Any]) -> str:
                     content.append(Paragraph(stripped_line.replace('## ', ''), styles['CustomSubtitle']))
                 else:
                     content.append(Paragraph(stripped_line, styles['Normal']))
-                content.append(Spacer(1, 6))
 
             doc.build(content)
             pdf_content = buffer.getvalue()
@@ -144,10 +144,18 @@ def export_to_docx(research_data: Dict[str, Any]) -> str:
         document.add_paragraph(research_data.get('response', 'No response available'))
 
         document.add_heading("Sources", level=1)
-        for source in research_data.get('sources', []):
-            document.add_paragraph(
-                f"{source.get('id', '?')}. {source.get('title', 'No title')} - {source.get('url', 'No URL')}"
-            )
+        # Build all sources as a single table rather than one paragraph per source
+        sources = research_data.get('sources', [])
+        table = document.add_table(rows=1 + len(sources), cols=3)
+        header_cells = table.rows[0].cells
+        header_cells[0].text = "ID"
+        header_cells[1].text = "Title"
+        header_cells[2].text = "URL"
+        for row, source in zip(table.rows[1:], sources):
+            cells = row.cells
+            cells[0].text = str(source.get('id', '?'))
+            cells[1].text = source.get('title', 'No title')
+            cells[2].text = source.get('url', 'No URL')
 
         with io.BytesIO() as buffer:
             document.save(buffer)
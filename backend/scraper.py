@@ -7,8 +7,15 @@ from datetime import datetime
 import os
 from typing import List, Dict, Any, Optional
 import logging
+from functools import lru_cache
+from concurrent.futures import ThreadPoolExecutor
 from urllib.parse import urlparse
-from serpapi.google_search import GoogleSearch
+from urllib.robotparser import RobotFileParser
+
+try:
+    import orjson as _json_parser
+except ImportError:  # orjson is optional; fall back to the standard library
+    import json as _json_parser
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
@@ -17,9 +24,18 @@ logger = logging.getLogger(__name__)
 # Rate limiting settings
 MIN_REQUEST_INTERVAL = 1  # Minimum time between requests in seconds
 
+# SerpAPI JSON endpoint, queried directly instead of through the SDK
+SERP_API_URL = "https://serpapi.com/search.json"
+
 # Maximum number of retries for retrieving content
 MAX_RETRIES = 3
 
+# Maximum number of characters of extracted text kept per source
+MAX_CONTENT_LENGTH = 10000
+
+# Pages larger than this (per the HEAD Content-Length) are skipped before downloading
+MAX_CONTENT_BYTES = 2_000_000
+
 # User-Agent list for randomization (expanded with additional browser-like headers)
 USER_AGENTS = [
     "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/108.0.0.0 Safari/537.36",
@@ -80,6 +96,65 @@ def get_website_text_content(url: str) -> str:
     logger.error(f"Failed to extract sufficient content from {url} after {MAX_RETRIES} attempts.")
     return ""
 
+@lru_cache(maxsize=256)
+def _get_robots_parser(scheme: str, netloc: str) -> Optional[RobotFileParser]:
+    """
+    Fetch and parse robots.txt for a host, cached per (scheme, netloc).
+
+    Returns:
+         A RobotFileParser, or None if robots.txt could not be retrieved.
+    """
+    robots_url = f"{scheme}://{netloc}/robots.txt"
+    try:
+        response = requests.get(robots_url, headers={"User-Agent": USER_AGENTS[0]}, timeout=5)
+    except requests.exceptions.RequestException as e:
+        logger.info(f"Could not fetch {robots_url}: {str(e)}")
+        return None
+    if not response.ok:
+        return None
+    parser = RobotFileParser(robots_url)
+    parser.parse(response.text.splitlines())
+    return parser
+
+def is_allowed_by_robots(url: str) -> bool:
+    """
+    Check whether robots.txt permits fetching the given URL.
+    Hosts without a reachable robots.txt are treated as allowing everything.
+    """
+    parsed_url = urlparse(url)
+    parser = _get_robots_parser(parsed_url.scheme or "https", parsed_url.netloc)
+    if parser is None:
+        return True
+    return parser.can_fetch("*", url)
+
+def passes_head_check(url: str) -> bool:
+    """
+    Issue a cheap HEAD request and reject URLs that are not HTML or are too large.
+    If the server does not answer HEAD properly, the URL is given the benefit of the doubt
+    and the regular GET path decides.
+    """
+    try:
+        head = requests.head(url, headers={"User-Agent": random.choice(USER_AGENTS)},
+                             timeout=5, allow_redirects=True)
+    except requests.exceptions.RequestException as e:
+        logger.info(f"HEAD request failed for {url}: {str(e)}")
+        return True
+    if not head.ok:
+        return True
+
+    content_type = head.headers.get('Content-Type', '').lower()
+    if content_type and 'text/html' not in content_type:
+        logger.info(f"Skipping non-HTML content from {url}: {content_type}")
+        return False
+    try:
+        content_length = int(head.headers.get('Content-Length', '0'))
+    except ValueError:
+        content_length = 0
+    if content_length > MAX_CONTENT_BYTES:
+        logger.info(f"Skipping oversized page {url}: {content_length} bytes")
+        return False
+    return True
+
 def search_web(query: str, recency: str = "Past month", num_results: int = 10) -> List[Dict[str, str]]:
     """
     Search for query results using the SERP API.
@@ -118,17 +193,17 @@ def search_web(query: str, recency: str = "Past month", num_results: int = 10) -
         search_params["tbs"] = f"qdr:{tbs_value}"
 
     try:
-        search = GoogleSearch(search_params)
-        search_results = search.get_dict()
-        organic_results = search_results.get("organic_results", [])
-        results = []
-        for result in organic_results:
-            results.append({
+        response = requests.get(SERP_API_URL, params=search_params, timeout=30)
+        response.raise_for_status()
+        search_results = _json_parser.loads(response.content)
+        return [
+            {
                 "title": result.get("title", "No Title"),
                 "url": result.get("link", ""),
                 "snippet": result.get("snippet", "")
-            })
-        return results
+            }
+            for result in search_results.get("organic_results", [])
+        ]
     except Exception as e:
         logger.error(f"Error searching Google for query '{query}': {str(e)}")
         return []
@@ -161,12 +236,20 @@ def search_and_extract_content(query: str,
 
     total_depth = search_depth
     results_per_category = max(1, total_depth // len(search_categories))
-    all_search_results = search_web(query, recency, results_per_category * 2)
 
-    # For additional category-specific searches (except 'general')
-    if search_depth >= 3:
-        for category in search_categories[1:]:
-            category_results = search_web(category["query"], recency, results_per_category)
+    # The searches are independent round-trips, so run them concurrently rather than one after another
+    extra_categories = search_categories[1:] if search_depth >= 3 else []
+    with ThreadPoolExecutor(max_workers=len(extra_categories) + 1) as executor:
+        general_future = executor.submit(search_web, query, recency, results_per_category * 2)
+        category_futures = [
+            (category, executor.submit(search_web, category["query"], recency, results_per_category))
+            for category in extra_categories
+        ]
+        all_search_results = general_future.result()
+
+        # For additional category-specific searches (except 'general')
+        for category, future in category_futures:
+            category_results = future.result()
             for result in category_results:
                 result["category"] = category["name"]
             all_search_results.extend(category_results)
@@ -208,6 +291,13 @@ def search_and_extract_content(query: str,
             logger.info(f"Skipping file URL: {url}")
             continue
 
+        if not is_allowed_by_robots(url):
+            logger.info(f"Skipping URL disallowed by robots.txt: {url}")
+            continue
+
+        if not passes_head_check(url):
+            continue
+
         # Pause between requests to avoid rate limits.
         sleep_duration = random.uniform(MIN_REQUEST_INTERVAL, MIN_REQUEST_INTERVAL * 2)
         time.sleep(sleep_duration)
@@ -219,9 +309,9 @@ def search_and_extract_content(query: str,
                 logger.warning(f"Insufficient content extracted from {url}, skipping")
                 continue
 
-            max_content_length = 10000
-            if len(content) > max_content_length:
-                content = content[:max_content_length] + "..."
+            if len(content) > MAX_CONTENT_LENGTH:
+                # Reserve room for the ellipsis so the stored text never exceeds the cap
+                content = f"{content[:MAX_CONTENT_LENGTH - 3]}..."
             result_with_content = {
                 "title": result.get("title", "No Title"),
                 "url": url,
@@ -2,48 +2,63 @@ import os
 import json
 import time
 import logging
-import random
-import string
 import re
+import secrets
+from collections import Counter
 from typing import Dict, Any, List, Optional
-from datetime import datetime, timedelta
+from datetime import datetime
+from pathlib import Path
 import hashlib
+import numpy as np
+
+try:
+    import orjson
+except ImportError:  # orjson is optional; fall back to the standard library
+    orjson = None
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Directory holding cached research results, resolved once at import time
+_CACHE_DIR = Path(__file__).resolve().parent.parent / '.cache'
+try:
+    _CACHE_DIR.mkdir(parents=True, exist_ok=True)
+except OSError as e:
+    logger.error(f"Error creating cache directory {_CACHE_DIR}: {e}")
+
+# Chat messages kept per session; older ones are dropped
+MAX_CHAT_HISTORY = 100
+
+# Tokenizer and stop words used by extract_keywords
+_WORD_RE = re.compile(r'\b\w+\b')
+_STOP_WORDS = frozenset({
+    'a', 'an', 'the', 'in', 'on', 'at', 'to', 'for', 'is', 'are', 'was',
+    'were', 'and', 'or', 'but', 'of'
+})
+
+# Markdown ATX heading (levels 1-6) on its own line
+_HEADING_RE = re.compile(r'^(#{1,6})[ \t]+(.*)$', re.MULTILINE)
+
 
 def generate_research_id() -> str:
     """
     Generate a unique ID for research sessions
     """
-    timestamp = int(time.time())
-    random_string = ''.join(
-        random.choices(string.ascii_lowercase + string.digits, k=8))
-    return f"research_{timestamp}_{random_string}"
+    return f"research_{int(time.time())}_{secrets.token_hex(4)}"
 
 
 def extract_keywords(text: str, max_keywords: int = 5) -> List[str]:
     """
     Extract key keywords from a text
     """
-    words = re.findall(r'\b\w+\b', text.lower())
-    stop_words = {
-        'a', 'an', 'the', 'in', 'on', 'at', 'to', 'for', 'is', 'are', 'was',
-        'were', 'and', 'or', 'but', 'of'
-    }
+    words = _WORD_RE.findall(text.lower())
     filtered_words = [
-        word for word in words if word not in stop_words and len(word) > 2
+        word for word in words if len(word) > 2 and word not in _STOP_WORDS
+    ]
+    return [
+        word for word, _ in Counter(filtered_words).most_common(max_keywords)
     ]
-    word_counts = {
-        word: filtered_words.count(word)
-        for word in set(filtered_words)
-    }
-    sorted_words = sorted(word_counts.items(),
-                          key=lambda x: x[1],
-                          reverse=True)
-    return [word for word, _ in sorted_words[:max_keywords]]
 
 
 def parse_markdown_headings(markdown_text: str) -> Dict[str, str]:
@@ -52,17 +67,16 @@ def parse_markdown_headings(markdown_text: str) -> Dict[str, str]:
     """
     sections = {}
     current_section = "Main"
-    current_content = []
+    content_start = 0
 
-    for line in markdown_text.split('\n'):
-        if line.startswith('# '):
-            sections[current_section] = '\n'.join(current_content)
-            current_section = line[2:].strip()
-            current_content = []
-        else:
-            current_content.append(line)
+    for match in _HEADING_RE.finditer(markdown_text):
+        # Slice the body out of the original text, minus the newline before the heading
+        sections[current_section] = markdown_text[
+            content_start:max(content_start, match.start() - 1)]
+        current_section = match.group(2).strip()
+        content_start = match.end() + 1
 
-    sections[current_section] = '\n'.join(current_content)
+    sections[current_section] = markdown_text[content_start:]
     return sections
 
 
@@ -85,17 +99,26 @@ def cache_research_results(research_id: str,
     """
     Cache research results to avoid redundant processing
     """
+    cache_file = _CACHE_DIR / f"{research_id}.json"
+    # Write to a temporary file and rename it into place so readers never see a partial file
+    tmp_file = cache_file.with_suffix('.json.tmp')
     try:
-        cache_dir = os.path.join(os.path.dirname(__file__), '../.cache')
-        os.makedirs(cache_dir, exist_ok=True)
-        cache_file = os.path.join(cache_dir, f"{research_id}.json")
-        data['_cache_expires'] = (
-            datetime.now() + timedelta(seconds=expire_seconds)).timestamp()
-        with open(cache_file, 'w') as f:
-            json.dump(data, f)
+        if orjson is not None:
+            tmp_file.write_bytes(orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS))
+        else:
+            with open(tmp_file, 'w', encoding='utf-8') as f:
+                json.dump(data, f, separators=(',', ':'), ensure_ascii=False)
+        # The expiry time is stored as the file's mtime so lookups can check it without parsing
+        now = time.time()
+        os.utime(tmp_file, (now, now + expire_seconds))
+        os.replace(tmp_file, cache_file)
         return True
     except Exception as e:
         logger.error(f"Error caching research results: {e}")
+        try:
+            tmp_file.unlink()
+        except OSError:
+            pass
         return False
 
 
@@ -104,18 +127,17 @@ def get_cached_research(research_id: str) -> Optional[Dict[str, Any]]:
     Retrieve cached research results if available and not expired
     """
     try:
-        cache_dir = os.path.join(os.path.dirname(__file__), '../.cache')
-        cache_file = os.path.join(cache_dir, f"{research_id}.json")
-        if not os.path.exists(cache_file):
+        cache_file = _CACHE_DIR / f"{research_id}.json"
+        try:
+            expires_at = cache_file.stat().st_mtime
+        except FileNotFoundError:
             return None
-        with open(cache_file, 'r') as f:
-            data = json.load(f)
-        if '_cache_expires' in data and datetime.now().timestamp(
-        ) > data['_cache_expires']:
-            os.remove(cache_file)
+        if time.time() > expires_at:
+            cache_file.unlink()
             return None
-        data.pop('_cache_expires', None)
-        return data
+        with open(cache_file, 'rb') as f:
+            payload = f.read()
+        return orjson.loads(payload) if orjson is not None else json.loads(payload)
     except Exception as e:
         logger.error(f"Error retrieving cached research: {e}")
         return None
@@ -126,4 +148,38 @@ def hash_query(query: str) -> str:
     Create a hash of a query string for cache lookups
     """
     normalized_query = ' '.join(query.lower().split())
-    return hashlib.md5(normalized_query.encode('utf-8')).hexdigest()
+    return hashlib.blake2b(normalized_query.encode('utf-8'),
+                           digest_size=16).hexdigest()
+
+
+def last_assistant_message(chat_history) -> Optional[Dict[str, Any]]:
+    """
+    Return the most recent assistant message, scanning the chat history from the end
+    """
+    return next((msg for msg in reversed(chat_history)
+                 if msg["role"] == "assistant"), None)
+
+
+def research_seed(chat_history) -> int:
+    """
+    Return a seed derived from the last assistant message, so dashboard example
+    data stays stable until new research arrives (user messages don't change it)
+
+    Builders should not seed a generator with it directly; use builder_rng so
+    each one draws from its own stream.
+    """
+    last_assistant = last_assistant_message(chat_history)
+    content = last_assistant["content"] if last_assistant else ""
+    return int.from_bytes(
+        hashlib.blake2b(content.encode('utf-8'), digest_size=8).digest(), 'big')
+
+
+def builder_rng(seed: int, tag: str):
+    """
+    Return a NumPy generator seeded from a seed and a per-builder tag
+
+    Builders sharing a seed would otherwise draw the same underlying numbers;
+    the tag gives each one an independent, reproducible stream.
+    """
+    digest = hashlib.blake2b(f"{seed}:{tag}".encode('utf-8'), digest_size=8)
+    return np.random.default_rng(int.from_bytes(digest.digest(), 'big'))
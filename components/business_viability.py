@@ -1,10 +1,11 @@
 import streamlit as st
 import plotly.express as px
 import plotly.graph_objects as go
+from plotly.subplots import make_subplots
 import pandas as pd
 import numpy as np
-import random
 from datetime import datetime
+from backend.utils import builder_rng, last_assistant_message, research_seed
 
 
 def render_business_viability():
@@ -19,29 +20,34 @@ def render_business_viability():
         )
         return
 
+    # The tab data below is cached per research, so reruns only redraw the charts
+    seed = research_seed(st.session_state.chat_history)
+
     # Create columns for key metrics
     col1, col2, col3, col4 = st.columns(4)
 
     # Generate random metrics for demonstration
     # In a real application, these would be derived from the research results
+    metrics = _build_key_metrics(seed)
+
     with col1:
         st.metric(label="Market Potential",
-                  value=f"${random.randint(50, 500)}B",
-                  delta=f"{random.uniform(2, 15):.1f}%")
+                  value=f"${metrics['market_potential']}B",
+                  delta=f"{metrics['market_growth']:.1f}%")
 
     with col2:
         st.metric(label="Viability Score",
-                  value=f"{random.randint(65, 95)}/100",
+                  value=f"{metrics['viability_score']}/100",
                   delta=None)
 
     with col3:
         st.metric(label="Competition",
-                  value=f"{random.choice(['Low', 'Moderate', 'High'])}",
+                  value=f"{metrics['competition']}",
                   delta=None)
 
     with col4:
         st.metric(label="Break-even Time",
-                  value=f"{random.randint(12, 48)} months",
+                  value=f"{metrics['break_even_months']} months",
                   delta=None)
 
     # Create tabs for different visualizations
@@ -51,31 +57,27 @@ def render_business_viability():
     ])
 
     with tab1:
-        render_financial_projection_tab()
+        render_financial_projection_tab(seed)
 
     with tab2:
-        render_market_fit_tab()
+        render_market_fit_tab(seed)
 
     with tab3:
-        render_risk_assessment_tab()
+        render_risk_assessment_tab(seed)
 
     with tab4:
-        render_success_metrics_tab()
+        render_success_metrics_tab(seed)
 
     # Summary box at the bottom
     st.subheader("Viability Summary")
 
     # Extract the last assistant message for the summary
-    assistant_messages = [
-        msg for msg in st.session_state.chat_history
-        if msg["role"] == "assistant"
-    ]
+    last_assistant = last_assistant_message(st.session_state.chat_history)
 
-    if assistant_messages:
-        last_message = assistant_messages[-1]["content"]
+    if last_assistant:
+        last_message = last_assistant["content"]
         # Take first paragraph as summary
-        summary = last_message.split(
-            '\n\n')[0] if '\n\n' in last_message else last_message
+        summary, _, _ = last_message.partition('\n\n')
         st.write(summary)
     else:
         st.write(
@@ -83,61 +85,76 @@ def render_business_viability():
         )
 
 
-def render_financial_projection_tab():
+@st.cache_data(ttl=3600)
+def _build_key_metrics(seed):
+    """Generates the headline metrics shown above the tabs"""
+    rng = builder_rng(seed, "metrics")
+    return {
+        "market_potential": rng.integers(50, 500, endpoint=True),
+        "market_growth": rng.uniform(2, 15),
+        "viability_score": rng.integers(65, 95, endpoint=True),
+        "competition": rng.choice(['Low', 'Moderate', 'High']),
+        "break_even_months": rng.integers(12, 48, endpoint=True)
+    }
+
+
+def render_financial_projection_tab(seed):
     """Renders the financial projection visualization tab"""
     st.subheader("Financial Projection Analysis")
 
+    projection_fig, cash_flow_fig = _build_financial_projection(seed)
+
+    st.plotly_chart(projection_fig, use_container_width=True)
+
+    # Monthly cash flow for first year
+    st.subheader("First Year Monthly Cash Flow")
+
+    st.plotly_chart(cash_flow_fig, use_container_width=True)
+
+
+@st.cache_data(ttl=3600)
+def _build_financial_projection(seed):
+    """Generates the financial projection and monthly cash flow figures"""
+    rng = builder_rng(seed, "financial")
     # Create example financial projection data
     # In a real application, this would be derived from the research results
-    years = list(range(datetime.now().year, datetime.now().year + 6))
+    current_year = datetime.now().year
+    years = np.arange(current_year, current_year + 6)
 
     # Generate random financial data
-    revenue = [0]
-    for i in range(1, 6):
-        revenue.append(random.uniform(0.5, 1.5) * (i * i) *
-                       100000)  # Quadratic growth pattern
+    growth_years = np.arange(1, 6)
+    revenue = np.concatenate(
+        ([0.0], rng.uniform(0.5, 1.5, 5) * (growth_years * growth_years) *
+         100000))  # Quadratic growth pattern
 
-    costs = [100000]  # Initial investment
-    for i in range(1, 6):
-        costs.append(
-            50000 +
-            (revenue[i] * random.uniform(0.4, 0.6)))  # Costs grow with revenue
+    costs = np.concatenate(
+        ([100000.0],  # Initial investment
+         50000 + revenue[1:] * rng.uniform(0.4, 0.6, 5)))  # Costs grow with revenue
 
-    profit = [revenue[i] - costs[i] for i in range(6)]
+    profit = revenue - costs
 
     # Create a DataFrame for the visualization
     df = pd.DataFrame({
-        'Year': years,
+        'Year': years.astype(np.int32),
         'Revenue': revenue,
         'Costs': costs,
         'Profit': profit
-    })
+    }, copy=False)
 
-    # Calculate break-even point
-    if all(p <= 0 for p in profit):
+    # Calculate break-even point from the first profitable year
+    profitable = profit > 0
+    if not profitable.any():
         breakeven_year = "Beyond projection"
     else:
-        for i, p in enumerate(profit):
-            if p > 0:
-                if i == 0:
-                    breakeven_year = f"Year {years[0]}"
-                else:
-                    # Interpolate for more precise break-even point
-                    prev_year = years[i - 1]
-                    curr_year = years[i]
-                    prev_profit = profit[i - 1]
-                    curr_profit = profit[i]
-                    if prev_profit >= 0:
-                        breakeven_year = f"Year {prev_year}"
-                    else:
-                        # Linear interpolation to find month
-                        months_after_prev = -prev_profit / (curr_profit -
-                                                            prev_profit) * 12
-                        breakeven_month = int(months_after_prev)
-                        breakeven_year = f"Year {prev_year}, Month {breakeven_month}"
-                break
+        i = int(profitable.argmax())
+        if i == 0:
+            breakeven_year = f"Year {years[0]}"
+        elif profit[i - 1] >= 0:
+            breakeven_year = f"Year {years[i - 1]}"
         else:
-            breakeven_year = "Beyond projection"
+            # Linear interpolation to find month
+            breakeven_month = int(-profit[i - 1] / (profit[i] - profit[i - 1]) * 12)
+            breakeven_year = f"Year {years[i - 1]}, Month {breakeven_month}"
 
     # Create and display chart
     fig = go.Figure()
@@ -180,28 +197,17 @@ def render_financial_projection_tab():
                     x=1),
         height=400)
 
-    st.plotly_chart(fig, use_container_width=True)
-
-    # Monthly cash flow for first year
-    st.subheader("First Year Monthly Cash Flow")
-
     # Generate monthly data for the first year
     months = [f"Month {i+1}" for i in range(12)]
-    monthly_revenue = [0]  # Start with zero
-    for i in range(1, 12):
-        # Gradually increasing revenue through the year
-        monthly_revenue.append(revenue[1] * i /
-                               36)  # Gradual ramp up to year 1 total
-
-    monthly_costs = [costs[0] / 4]  # Initial setup cost
-    for i in range(1, 12):
-        monthly_costs.append(
-            costs[1] / 12 +
-            random.uniform(-5000, 5000))  # Monthly costs with some variance
-
-    monthly_cash_flow = [
-        monthly_revenue[i] - monthly_costs[i] for i in range(12)
-    ]
+    # Gradual ramp up to year 1 total, starting with zero
+    monthly_revenue = revenue[1] * np.arange(12) / 36
+
+    monthly_costs = np.concatenate(
+        ([costs[0] / 4],  # Initial setup cost
+         costs[1] / 12 +
+         rng.uniform(-5000, 5000, 11)))  # Monthly costs with some variance
+
+    monthly_cash_flow = monthly_revenue - monthly_costs
     cumulative_cash_flow = np.cumsum(monthly_cash_flow)
 
     # Create a DataFrame for the visualization
@@ -211,7 +217,7 @@ def render_financial_projection_tab():
         'Costs': monthly_costs,
         'Cash Flow': monthly_cash_flow,
         'Cumulative': cumulative_cash_flow
-    })
+    }, copy=False)
 
     # Create and display chart
     fig2 = go.Figure()
@@ -221,10 +227,8 @@ def render_financial_projection_tab():
         go.Bar(x=monthly_df['Month'],
                y=monthly_df['Cash Flow'],
                name='Monthly Cash Flow',
-               marker_color=[
-                   '#FF6B6B' if cf < 0 else '#00A67E'
-                   for cf in monthly_cash_flow
-               ]))
+               marker_color=np.where(monthly_cash_flow < 0, '#FF6B6B',
+                                     '#00A67E')))
 
     # Cumulative line
     fig2.add_trace(
@@ -246,101 +250,108 @@ def render_financial_projection_tab():
                                    x=1),
                        height=400)
 
-    st.plotly_chart(fig2, use_container_width=True)
+    return fig, fig2
 
 
-def render_market_fit_tab():
+def render_market_fit_tab(seed):
     """Renders the market fit visualization tab"""
     st.subheader("Product-Market Fit Analysis")
 
+    fit_fig, segments_fig, problem_fig = _build_market_fit(seed)
+
     # Create market fit metrics
     col1, col2 = st.columns(2)
 
     with col1:
-        # Product-Market Fit Radar Chart
-        categories = [
-            'Solving Real Problem', 'Target Market Size', 'Willingness to Pay',
-            'Market Timing', 'Competitive Advantage', 'Scalability'
-        ]
-
-        # Generate random scores for demonstration
-        market_fit_scores = [
-            random.uniform(5, 10) for _ in range(len(categories))
-        ]
-        ideal_scores = [10] * len(categories)
-
-        # Calculate overall fit percentage
-        fit_percentage = sum(market_fit_scores) / sum(ideal_scores) * 100
-
-        # Create a DataFrame
-        df = pd.DataFrame({
-            'Category':
-            categories + categories,
-            'Score':
-            market_fit_scores + ideal_scores,
-            'Type': ['Current'] * len(categories) + ['Ideal'] * len(categories)
-        })
-
-        # Create radar chart
-        fig = px.line_polar(df,
-                            r='Score',
-                            theta='Category',
-                            color='Type',
-                            line_close=True,
-                            color_discrete_sequence=['#00A67E', '#0A2540'],
-                            range_r=[0, 10])
-
-        fig.update_layout(
-            title=f'Product-Market Fit Assessment: {fit_percentage:.1f}%',
-            polar=dict(radialaxis=dict(visible=True, range=[0, 10])),
-            showlegend=True,
-            height=400)
-
-        st.plotly_chart(fig, use_container_width=True)
+        st.plotly_chart(fit_fig, use_container_width=True)
 
     with col2:
         # Target Market Analysis
         st.subheader("Target Market Segments")
 
-        # Example market segments
-        segments = [
-            'Segment A', 'Segment B', 'Segment C', 'Segment D', 'Others'
-        ]
-        market_sizes = [random.uniform(10, 40) for _ in range(4)]
-        market_sizes.append(100 - sum(market_sizes))  # Others
+        st.plotly_chart(segments_fig, use_container_width=True)
 
-        growth_rates = [random.uniform(-5, 20) for _ in range(len(segments))]
+    # Customer Problem-Solution Fit
+    st.subheader("Problem-Solution Fit")
 
-        # Create a DataFrame
-        market_df = pd.DataFrame({
-            'Segment': segments,
-            'Market Size (%)': market_sizes,
-            'Growth Rate (%)': growth_rates
-        })
+    st.plotly_chart(problem_fig, use_container_width=True)
 
-        # Create treemap
-        fig2 = px.treemap(
-            market_df,
-            path=['Segment'],
-            values='Market Size (%)',
-            color='Growth Rate (%)',
-            color_continuous_scale=['#FF6B6B', '#FFFFFF', '#00A67E'],
-            color_continuous_midpoint=0)
 
-        fig2.update_layout(title='Target Market Segmentation', height=400)
+@st.cache_data(ttl=3600)
+def _build_market_fit(seed):
+    """Generates the market fit radar, segment treemap and problem-solution figures"""
+    rng = builder_rng(seed, "market_fit")
+    # Product-Market Fit Radar Chart
+    categories = [
+        'Solving Real Problem', 'Target Market Size', 'Willingness to Pay',
+        'Market Timing', 'Competitive Advantage', 'Scalability'
+    ]
 
-        st.plotly_chart(fig2, use_container_width=True)
+    # Generate random scores for demonstration
+    market_fit_scores = rng.uniform(5, 10, len(categories))
+    ideal_scores = np.full(len(categories), 10.0)
 
-    # Customer Problem-Solution Fit
-    st.subheader("Problem-Solution Fit")
+    # Calculate overall fit percentage
+    fit_percentage = market_fit_scores.sum() / ideal_scores.sum() * 100
+
+    # Create a DataFrame
+    df = pd.DataFrame({
+        'Category':
+        categories + categories,
+        'Score':
+        np.concatenate([market_fit_scores, ideal_scores]),
+        'Type': ['Current'] * len(categories) + ['Ideal'] * len(categories)
+    }, copy=False)
+
+    # Create radar chart
+    fig = px.line_polar(df,
+                        r='Score',
+                        theta='Category',
+                        color='Type',
+                        line_close=True,
+                        color_discrete_sequence=['#00A67E', '#0A2540'],
+                        range_r=[0, 10])
+
+    fig.update_layout(
+        title=f'Product-Market Fit Assessment: {fit_percentage:.1f}%',
+        polar=dict(radialaxis=dict(visible=True, range=[0, 10])),
+        showlegend=True,
+        height=400)
+
+    # Example market segments
+    segments = [
+        'Segment A', 'Segment B', 'Segment C', 'Segment D', 'Others'
+    ]
+    market_sizes = rng.uniform(10, 40, 4)
+    market_sizes = np.append(market_sizes, 100 - market_sizes.sum())  # Others
+
+    growth_rates = rng.uniform(-5, 20, len(segments))
+
+    # Create a DataFrame
+    market_df = pd.DataFrame({
+        'Segment': segments,
+        'Market Size (%)': market_sizes,
+        'Growth Rate (%)': growth_rates
+    }, copy=False)
+
+    # Create treemap
+    fig2 = px.treemap(
+        market_df,
+        path=['Segment'],
+        values='Market Size (%)',
+        color='Growth Rate (%)',
+        color_continuous_scale=['#FF6B6B', '#FFFFFF', '#00A67E'],
+        color_continuous_midpoint=0)
+
+    fig2.update_layout(title='Target Market Segmentation', height=400)
 
     # Example problems and solution fit
     problems = [
         'Problem 1', 'Problem 2', 'Problem 3', 'Problem 4', 'Problem 5'
     ]
 
-    solution_scores = [random.uniform(5, 10) for _ in range(len(problems))]
-    importance_scores = [random.uniform(5, 10) for _ in range(len(problems))]
+    solution_scores = rng.uniform(5, 10, len(problems))
+    importance_scores = rng.uniform(5, 10, len(problems))
 
     # Create DataFrame
     problem_df = pd.DataFrame({
@@ -350,11 +361,9 @@ def render_market_fit_tab():
         solution_scores,
         'Problem Importance':
         importance_scores,
-        'Score': [
-            solution_scores[i] * importance_scores[i] / 10
-            for i in range(len(problems))
-        ]
-    })
+        'Score':
+        solution_scores * importance_scores / 10
+    }, copy=False)
 
     # Sort by score
     problem_df = problem_df.sort_values('Score', ascending=False)
@@ -374,13 +383,58 @@ def render_market_fit_tab():
                        yaxis=dict(title='Customer Problem'),
                        height=350)
 
-    st.plotly_chart(fig3, use_container_width=True)
+    return fig, fig2, fig3
 
 
-def render_risk_assessment_tab():
+def render_risk_assessment_tab(seed):
     """Renders the risk assessment visualization tab"""
     st.subheader("Business Risk Assessment")
 
+    risk_fig, top_risks = _build_risk_assessment(seed)
+
+    st.plotly_chart(risk_fig, use_container_width=True)
+
+    # Risk mitigation strategies
+    st.subheader("Risk Mitigation Strategies")
+
+    # Display top 3 risks with mitigation strategies
+    for i, (category, score, contingency) in enumerate(top_risks):
+        with st.container(border=True):
+            cols = st.columns([1, 4])
+
+            with cols[0]:
+                st.markdown(f"### {i+1}")
+                severity = "High" if score > 3.5 else "Medium" if score > 2 else "Low"
+                severity_color = "red" if severity == "High" else "orange" if severity == "Medium" else "green"
+                st.markdown(
+                    f"<p style='color:{severity_color};font-weight:bold'>{severity}</p>",
+                    unsafe_allow_html=True)
+                st.metric("Score", f"{score:.1f}/5")
+
+            with cols[1]:
+                st.subheader(category)
+
+                # Generate example mitigation strategies
+                mitigations = [
+                    "Diversify supplier relationships to reduce dependency risks",
+                    "Implement robust financial controls and cash flow monitoring",
+                    "Develop contingency plans for key operational disruptions",
+                    "Establish regulatory compliance monitoring and updates",
+                    "Conduct regular market intelligence to track competitive landscape"
+                ]
+
+                st.markdown("**Mitigation Strategy:**")
+                st.markdown(f"- {mitigations[i % len(mitigations)]}")
+                st.markdown(
+                    f"- Monitor {category.lower()} quarterly")
+                st.markdown(
+                    f"- Allocate {contingency}% contingency budget")
+
+
+@st.cache_data(ttl=3600)
+def _build_risk_assessment(seed):
+    """Generates the risk matrix figure and the top 3 risks by score"""
+    rng = builder_rng(seed, "risk")
     # Risk matrix
     risk_categories = [
         'Market Risks', 'Financial Risks', 'Operational Risks',
@@ -388,14 +442,9 @@ def render_risk_assessment_tab():
     ]
 
     # Generate random scores for demonstration
-    impact_scores = [random.uniform(1, 5) for _ in range(len(risk_categories))]
-    probability_scores = [
-        random.uniform(1, 5) for _ in range(len(risk_categories))
-    ]
-    risk_scores = [
-        impact_scores[i] * probability_scores[i] / 5
-        for i in range(len(risk_categories))
-    ]
+    impact_scores = rng.uniform(1, 5, len(risk_categories))
+    probability_scores = rng.uniform(1, 5, len(risk_categories))
+    risk_scores = impact_scores * probability_scores / 5
 
     # Create a DataFrame
     risk_df = pd.DataFrame({
@@ -403,7 +452,7 @@ def render_risk_assessment_tab():
         'Impact': impact_scores,
         'Probability': probability_scores,
         'Risk Score': risk_scores
-    })
+    }, copy=False)
 
     # Create risk matrix bubble chart
     fig = px.scatter(risk_df,
@@ -459,55 +508,27 @@ def render_risk_assessment_tab():
                       yaxis=dict(title='Impact', range=[0, 5]),
                       height=500)
 
-    st.plotly_chart(fig, use_container_width=True)
+    # Select the top 3 risks by score without sorting all of them
+    top_idx = np.argpartition(-risk_scores,
+                              min(3, len(risk_scores) - 1))[:3]
+    top_idx = top_idx[np.argsort(-risk_scores[top_idx])]
 
-    # Risk mitigation strategies
-    st.subheader("Risk Mitigation Strategies")
+    # Contingency budget (%) suggested for each of the top 3 risks
+    contingencies = rng.integers(5, 15, size=len(top_idx), endpoint=True)
 
-    # Sort risks by score
-    risk_df = risk_df.sort_values('Risk Score', ascending=False)
+    top_risks = [(risk_categories[idx], risk_scores[idx], contingency)
+                 for idx, contingency in zip(top_idx, contingencies)]
 
-    # Display top 3 risks with mitigation strategies
-    for i in range(min(3, len(risk_df))):
-        risk = risk_df.iloc[i]
-        with st.container(border=True):
-            cols = st.columns([1, 4])
+    return fig, top_risks
 
-            with cols[0]:
-                st.markdown(f"### {i+1}")
-                severity = "High" if risk[
-                    'Risk Score'] > 3.5 else "Medium" if risk[
-                        'Risk Score'] > 2 else "Low"
-                severity_color = "red" if severity == "High" else "orange" if severity == "Medium" else "green"
-                st.markdown(
-                    f"<p style='color:{severity_color};font-weight:bold'>{severity}</p>",
-                    unsafe_allow_html=True)
-                st.metric("Score", f"{risk['Risk Score']:.1f}/5")
 
-            with cols[1]:
-                st.subheader(risk['Risk Category'])
-
-                # Generate example mitigation strategies
-                mitigations = [
-                    "Diversify supplier relationships to reduce dependency risks",
-                    "Implement robust financial controls and cash flow monitoring",
-                    "Develop contingency plans for key operational disruptions",
-                    "Establish regulatory compliance monitoring and updates",
-                    "Conduct regular market intelligence to track competitive landscape"
-                ]
-
-                st.markdown("**Mitigation Strategy:**")
-                st.markdown(f"- {mitigations[i % len(mitigations)]}")
-                st.markdown(
-                    f"- Monitor {risk['Risk Category'].lower()} quarterly")
-                st.markdown(
-                    f"- Allocate {random.randint(5, 15)}% contingency budget")
-
-
-def render_success_metrics_tab():
+def render_success_metrics_tab(seed):
     """Renders the success metrics visualization tab"""
     st.subheader("Key Success Metrics & KPIs")
 
+    financial_kpis, growth_kpis, factors_fig = _build_success_metrics(
+        seed)
+
     # Create columns for different metric categories
     col1, col2 = st.columns(2)
 
@@ -515,14 +536,6 @@ def render_success_metrics_tab():
         # Financial KPIs
         st.markdown("### Financial KPIs")
 
-        financial_kpis = {
-            "Customer Acquisition Cost (CAC)": f"${random.randint(100, 500)}",
-            "Customer Lifetime Value (LTV)": f"${random.randint(1000, 5000)}",
-            "LTV:CAC Ratio": f"{random.uniform(2, 8):.1f}",
-            "Break-even Point": f"{random.randint(12, 36)} months",
-            "Gross Margin": f"{random.uniform(30, 70):.1f}%"
-        }
-
         for kpi, value in financial_kpis.items():
             st.metric(label=kpi, value=value)
 
@@ -530,21 +543,36 @@ def render_success_metrics_tab():
         # Growth KPIs
         st.markdown("### Growth KPIs")
 
-        growth_kpis = {
-            "Market Share Target": f"{random.uniform(1, 25):.1f}%",
-            "User/Customer Growth Rate":
-            f"{random.uniform(5, 50):.1f}% monthly",
-            "Activation Rate": f"{random.uniform(20, 80):.1f}%",
-            "Retention Rate": f"{random.uniform(40, 95):.1f}%",
-            "NPS (Net Promoter Score)": f"{random.randint(20, 80)}"
-        }
-
         for kpi, value in growth_kpis.items():
             st.metric(label=kpi, value=value)
 
     # Critical success factors
     st.subheader("Critical Success Factors")
 
+    st.plotly_chart(factors_fig, use_container_width=True)
+
+
+@st.cache_data(ttl=3600)
+def _build_success_metrics(seed):
+    """Generates the financial and growth KPIs and the success factor gauges"""
+    rng = builder_rng(seed, "success")
+    financial_kpis = {
+        "Customer Acquisition Cost (CAC)": f"${rng.integers(100, 500, endpoint=True)}",
+        "Customer Lifetime Value (LTV)": f"${rng.integers(1000, 5000, endpoint=True)}",
+        "LTV:CAC Ratio": f"{rng.uniform(2, 8):.1f}",
+        "Break-even Point": f"{rng.integers(12, 36, endpoint=True)} months",
+        "Gross Margin": f"{rng.uniform(30, 70):.1f}%"
+    }
+
+    growth_kpis = {
+        "Market Share Target": f"{rng.uniform(1, 25):.1f}%",
+        "User/Customer Growth Rate":
+        f"{rng.uniform(5, 50):.1f}% monthly",
+        "Activation Rate": f"{rng.uniform(20, 80):.1f}%",
+        "Retention Rate": f"{rng.uniform(40, 95):.1f}%",
+        "NPS (Net Promoter Score)": f"{rng.integers(20, 80, endpoint=True)}"
+    }
+
     # Example success factors
     success_factors = [
         "Market Penetration Rate", "Strategic Partnerships",
@@ -553,31 +581,18 @@ def render_success_metrics_tab():
     ]
 
     # Generate scores and thresholds
-    factor_scores = [
-        random.uniform(0, 100) for _ in range(len(success_factors))
-    ]
-    factor_thresholds = [
-        random.uniform(40, 70) for _ in range(len(success_factors))
-    ]
-
-    # Create DataFrame
-    csf_df = pd.DataFrame({
-        'Factor': success_factors,
-        'Current Score': factor_scores,
-        'Minimum Threshold': factor_thresholds
-    })
+    factor_scores = rng.uniform(0, 100, len(success_factors))
+    factor_thresholds = rng.uniform(40, 70, len(success_factors))
 
-    # Create bullet chart
-    fig = go.Figure()
+    # Create bullet chart, one gauge per subplot row
+    fig = make_subplots(rows=len(success_factors),
+                        cols=1,
+                        specs=[[{'type': 'indicator'}]] * len(success_factors))
 
     for i, factor in enumerate(success_factors):
         fig.add_trace(
             go.Indicator(mode="gauge+number",
                          value=factor_scores[i],
-                         domain={
-                             'row': i,
-                             'column': 0
-                         },
                          title={'text': factor},
                          gauge={
                              'axis': {
@@ -604,14 +619,11 @@ def render_success_metrics_tab():
                              'bar': {
                                  'color': "#0A2540"
                              }
-                         }))
+                         }),
+            row=i + 1,
+            col=1)
 
     # Update layout
-    fig.update_layout(grid={
-        'rows': len(success_factors),
-        'columns': 1,
-        'pattern': "independent"
-    },
-                      height=100 * len(success_factors) + 50)
-
-    st.plotly_chart(fig, use_container_width=True)
+    fig.update_layout(height=100 * len(success_factors) + 50)
+
+    return financial_kpis, growth_kpis, fig
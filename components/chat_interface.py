@@ -1,61 +1,161 @@
 import streamlit as st
-from backend.ai_integration import generate_ai_response
+import hashlib
+import json
+import threading
+import time
+from collections import OrderedDict, deque
+from backend.ai_integration import format_sources, generate_ai_response_stream, is_error_response
 from backend.scraper import search_and_extract_content
+from backend.utils import MAX_CHAT_HISTORY
 from datetime import datetime
+from urllib.parse import urlsplit, urlunsplit
+
+
+# Only the most recent messages are drawn by default
+RECENT_MESSAGES = 20
+
+# How long a cached web search stays fresh, in seconds; recent-only searches go stale sooner
+SEARCH_MAX_AGE = 86400
+SEARCH_MAX_AGE_BY_RECENCY = {"Past day": 3600, "Past week": 21600}
+
+# Finished AI responses are reused for this long, up to this many entries
+AI_RESPONSE_TTL = 1800
+AI_RESPONSE_MAX_ENTRIES = 128
+
+# Streamed responses can't go through st.cache_data, so the final text is kept here instead,
+# keyed by (query, model, sources key) and holding (stored_at, response)
+_ai_responses = OrderedDict()
+_ai_responses_lock = threading.Lock()
 
 
 def initialize_session():
     """Initializes session state variables if not set"""
     if "chat_history" not in st.session_state:
-        st.session_state.chat_history = []
+        st.session_state.chat_history = deque(maxlen=MAX_CHAT_HISTORY)
+    elif not isinstance(st.session_state.chat_history, deque):
+        st.session_state.chat_history = deque(st.session_state.chat_history,
+                                              maxlen=MAX_CHAT_HISTORY)
     if "research_sources" not in st.session_state:
         st.session_state.research_sources = []
 
 
-def render_chat_interface(ai_model):
+def _canonical_url(url):
+    """Normalizes a URL so trivially different spellings of the same page compare equal"""
+    parts = urlsplit(url)
+    return urlunsplit((parts.scheme.lower(), parts.netloc.lower(),
+                       parts.path.rstrip('/'), parts.query, ''))
+
+
+class _EmptySearchResults(Exception):
+    """Raised inside the search cache so failed or empty searches are never stored"""
+
+
+@st.cache_data(persist="disk", max_entries=512, show_spinner=False)
+def _persisted_search(query, recency, search_depth, custom_urls, age_bucket):
+    """Searches and extracts web content, persisting non-empty results to disk
+
+    Streamlit ignores ttl for disk-persisted caches, so freshness comes from
+    age_bucket instead: once the bucket rolls over, older entries are never
+    looked up again and max_entries evicts them.
     """
-    Renders the chat interface for research queries
+    results = search_and_extract_content(query=query,
+                                         recency=recency,
+                                         search_depth=search_depth,
+                                         custom_urls=list(custom_urls))
+    if not results:
+        raise _EmptySearchResults(query)
+    return results
 
-    Args:
-        ai_model (str): The selected AI model to use for responses
+
+def _cached_search(query, recency, search_depth, custom_urls):
+    """Searches and extracts web content, reusing results for repeated queries while they are fresh"""
+    max_age = SEARCH_MAX_AGE_BY_RECENCY.get(recency, SEARCH_MAX_AGE)
+    try:
+        return _persisted_search(query, recency, search_depth, custom_urls,
+                                 int(time.time() // max_age))
+    except _EmptySearchResults:
+        return []
+
+
+def _sources_key(search_results):
+    """Returns a short key identifying a set of search results by their URLs and titles"""
+    payload = json.dumps([{
+        'url': s['url'],
+        'title': s.get('title', '')
+    } for s in search_results],
+                         sort_keys=True)
+    return hashlib.blake2b(payload.encode('utf-8'), digest_size=16).hexdigest()
+
+
+def _get_cached_ai_response(key):
+    """Returns the stored response for key, or None if it is missing or older than the TTL"""
+    with _ai_responses_lock:
+        entry = _ai_responses.get(key)
+        if entry is None:
+            return None
+        stored_at, response = entry
+        if time.time() - stored_at > AI_RESPONSE_TTL:
+            del _ai_responses[key]
+            return None
+        _ai_responses.move_to_end(key)
+        return response
+
+
+def _store_ai_response(key, response):
+    """Stores a finished response, evicting the least recently used entries beyond the cap
+
+    Error text (missing API key, failed API call) is never stored, so fixing the
+    problem takes effect on the next request.
     """
-    initialize_session()
-    st.header("Research Assistant")
+    if is_error_response(response):
+        return
+    with _ai_responses_lock:
+        _ai_responses[key] = (time.time(), response)
+        _ai_responses.move_to_end(key)
+        while len(_ai_responses) > AI_RESPONSE_MAX_ENTRIES:
+            _ai_responses.popitem(last=False)
+
 
+def _render_message(message):
+    """Renders a single chat message with its sources"""
+    with st.chat_message(message["role"]):
+        st.markdown(message["content"])
+        if "sources" in message and message["sources"]:
+            _render_sources(message["sources"])
+
+
+def _render_sources(sources):
+    """Renders a message's sources in an expander"""
+    with st.expander("Sources"):
+        st.markdown("\n".join(f"{idx}. [{source['title']}]({source['url']})"
+                              for idx, source in enumerate(sources, 1)))
+
+
+@st.fragment
+def _chat_fragment(ai_model):
+    """Renders the chat history and query form as a fragment so submits don't rerun the whole app"""
     # Chat message container
     chat_container = st.container()
 
     with chat_container:
-        for message in st.session_state.chat_history:
-            with st.chat_message(message["role"]):
-                st.markdown(message["content"])
-                if "sources" in message and message["sources"]:
-                    with st.expander("Sources"):
-                        for idx, source in enumerate(message["sources"]):
-                            st.markdown(
-                                f"{idx+1}. [{source['title']}]({source['url']})"
-                            )
+        messages = list(st.session_state.chat_history)
+        older_messages = messages[:-RECENT_MESSAGES]
+        # Older messages are only drawn on request to keep reruns cheap
+        if older_messages and st.toggle(
+                f"Show {len(older_messages)} older messages",
+                key="chat_show_older"):
+            for message in older_messages:
+                _render_message(message)
+        for message in messages[-RECENT_MESSAGES:]:
+            _render_message(message)
 
     # Query input
     st.write("### Ask a research question")
 
-    col1, col2 = st.columns([5, 1])
-
-    with col1:
-        user_query = st.text_input(
-            "Enter your research query",
-            placeholder=
-            "Example: Analyze the market trends for electric vehicles in Europe",
-            label_visibility="collapsed",
-            key="chat_query_input")
-
-    with col2:
-        search_button = st.button("Research",
-                                  type="primary",
-                                  key="chat_search_button")
-
     advanced_options = st.expander("Advanced Options")
 
+    # Options are read when a query is submitted, so there's no separate apply step whose
+    # pending edits could be silently dropped; editing them only reruns this fragment
     with advanced_options:
         col1, col2 = st.columns(2)
         with col1:
@@ -84,59 +184,89 @@ def render_chat_interface(ai_model):
             help="Add specific sources you want to include in the research",
             key="chat_custom_sources")
 
-    # Process the research query when button is clicked
-    if search_button and user_query:
-        with st.spinner(f"Researching '{user_query}' using {ai_model}..."):
-            # Add user message to chat history
-            st.session_state.chat_history.append({
-                "role":
-                "user",
-                "content":
-                user_query,
-                "timestamp":
-                datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-            })
-
-            # Get custom URLs if provided
-            custom_urls = [
-                url.strip() for url in custom_sources.split("\n")
-                if url.strip()
-            ] if custom_sources else []
+    user_query = st.chat_input(
+        "Example: Analyze the market trends for electric vehicles in Europe",
+        key="chat_query_input")
+
+    # Process the research query when it is submitted
+    if user_query:
+        # One timestamp for both messages of this exchange
+        timestamp = datetime.now().isoformat(sep=' ', timespec='seconds')
+
+        # Add user message to chat history
+        st.session_state.chat_history.append({
+            "role": "user",
+            "content": user_query,
+            "timestamp": timestamp
+        })
+
+        # Get custom URLs if provided, deduplicated and sorted for a stable cache key
+        custom_urls = sorted({
+            _canonical_url(url)
+            for url in (line.strip() for line in custom_sources.splitlines())
+            if url
+        }) if custom_sources else []
+
+        with chat_container:
+            with st.chat_message("user"):
+                st.markdown(user_query)
 
             try:
-                # Search and extract web content
-                search_results = search_and_extract_content(
-                    query=user_query,
-                    recency=recency,
-                    search_depth=search_depth,
-                    custom_urls=custom_urls)
+                with st.spinner(
+                        f"Researching '{user_query}' using {ai_model}..."):
+                    # Search and extract web content
+                    search_results = _cached_search(
+                        user_query, recency, search_depth,
+                        tuple(custom_urls))
 
                 # Save sources to session state
                 st.session_state.research_sources = search_results
+                formatted_sources = format_sources(search_results)
 
-                # Generate AI response based on the extracted content
-                response, formatted_sources = generate_ai_response(
-                    query=user_query,
-                    search_results=search_results,
-                    model=ai_model)
+                # Reuse a finished response for the same query, model and sources,
+                # otherwise stream it into the chat as it is generated
+                response_key = (user_query, ai_model,
+                                _sources_key(search_results))
+                response = _get_cached_ai_response(response_key)
+                with st.chat_message("assistant"):
+                    if response is not None:
+                        st.markdown(response)
+                    else:
+                        response = st.write_stream(
+                            generate_ai_response_stream(
+                                query=user_query,
+                                search_results=search_results,
+                                model=ai_model,
+                                formatted_sources=formatted_sources))
+                        _store_ai_response(response_key, response)
+                    if formatted_sources:
+                        _render_sources(formatted_sources)
 
                 # Add AI response to chat history
                 st.session_state.chat_history.append({
-                    "role":
-                    "assistant",
-                    "content":
-                    response,
-                    "sources":
-                    formatted_sources,
-                    "timestamp":
-                    datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+                    "role": "assistant",
+                    "content": response,
+                    "sources": formatted_sources,
+                    "timestamp": timestamp
                 })
-
-                # Refresh to display new messages
-                st.rerun()
             except Exception as e:
                 st.error(f"An error occurred: {e}")
 
+def render_chat_interface(ai_model):
+    """
+    Renders the chat interface for research queries
+
+    This is a standalone follow-up chat panel; app.py does not mount it and runs
+    its own one-shot research flow instead.
+
+    Args:
+        ai_model (str): The selected AI model to use for responses
+    """
+    initialize_session()
+    st.header("Research Assistant")
+
+    _chat_fragment(ai_model)
+
     # Disclaimer about AI models
     st.caption(
         "Note: Free tier AI models are used which may have knowledge cutoffs and limitations."
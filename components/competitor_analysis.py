@@ -1,14 +1,103 @@
 import streamlit as st
-import random
-import numpy as np
 import plotly.express as px
-import plotly.graph_objects as go
 import pandas as pd
+import numpy as np
+import random
+from backend.utils import builder_rng
+
+# Static SWOT quadrants, two per column
+_SWOT_LEFT = ("### Strengths\n"
+              "- Strong brand recognition\n"
+              "- Innovative product portfolio\n"
+              "- Efficient supply chain\n\n"
+              "### Weaknesses\n"
+              "- High operational costs\n"
+              "- Limited market reach\n"
+              "- Product gaps")
+_SWOT_RIGHT = ("### Opportunities\n"
+               "- Emerging markets\n"
+               "- Digital transformation\n"
+               "- Strategic partnerships\n\n"
+               "### Threats\n"
+               "- Intense competition\n"
+               "- Regulatory changes\n"
+               "- Market volatility")
+
+
+def _session_seed():
+    """Returns a per-session seed so the demonstration data stays stable across reruns
+
+    The data helpers below are keyed on this seed, so their caches carry a TTL and
+    an entry cap; otherwise every new session would add entries that are never evicted.
+    """
+    if "competitor_seed" not in st.session_state:
+        st.session_state.competitor_seed = random.randrange(2**32)
+    return st.session_state.competitor_seed
+
+
+@st.cache_data(ttl=3600, max_entries=128)
+def _headline_metrics(name, seed):
+    """Generates the headline metrics for a competitor selection"""
+    rng = random.Random(f"{seed}:{name}:headline")
+    return {
+        "market_share": rng.uniform(5, 30),
+        "market_share_delta": rng.uniform(-5, 5),
+        "revenue_growth": rng.uniform(-5, 25),
+        "revenue_growth_delta": rng.uniform(-10, 10),
+        "product_count": rng.randint(5, 50),
+        "product_count_delta": rng.randint(-5, 10),
+        "pricing_index": rng.uniform(80, 120),
+        "pricing_index_delta": rng.uniform(-10, 10)
+    }
+
+
+@st.cache_data(ttl=3600, max_entries=128)
+def _competitor_metrics(name, seed):
+    """Generates the detail metrics for a single competitor"""
+    rng = random.Random(f"{seed}:{name}")
+    return {
+        "Market Share": f"{rng.uniform(5, 30):.1f}%",
+        "Annual Revenue": f"${rng.uniform(10, 100):.1f}M",
+        "Growth Rate": f"{rng.uniform(-5, 25):.1f}%",
+        "Customer Satisfaction": f"{rng.uniform(3.5, 4.8):.1f}/5.0"
+    }
+
+
+@st.cache_data(ttl=3600, max_entries=128)
+def _market_df(seed):
+    """Generates the market share and growth data for the market overview"""
+    rng = builder_rng(seed, "market")
+    companies = [
+        'Company A', 'Company B', 'Company C', 'Company D', 'Company E'
+    ]
+    return pd.DataFrame({
+        'Company':
+        np.asarray(companies, dtype=object),
+        'Market Share (%)': rng.uniform(5, 30, len(companies)),
+        'Growth Rate (%)': rng.uniform(-5, 25, len(companies))
+    }, copy=False)
+
+
+@st.cache_data(ttl=3600, max_entries=128)
+def _bcg_df(seed):
+    """Generates the product data for the growth-share matrix"""
+    rng = builder_rng(seed, "bcg")
+    products = [
+        'Product A', 'Product B', 'Product C', 'Product D', 'Product E'
+    ]
+    return pd.DataFrame({
+        'Product':
+        np.asarray(products, dtype=object),
+        'Market Share (%)': rng.uniform(0, 50, len(products)),
+        'Growth Rate (%)': rng.uniform(-10, 30, len(products)),
+        'Revenue (M)': rng.uniform(10, 100, len(products))
+    }, copy=False)
 
 
 def render_competitor_analysis():
     """Renders the competitor analysis visualization panel"""
     st.header("Competitor Analysis Dashboard")
+    seed = _session_seed()
 
     competitors = [
         'All Competitors', 'Company A', 'Company B', 'Company C', 'Company D',
@@ -17,76 +106,80 @@ def render_competitor_analysis():
     selected_competitor = st.selectbox("Select Competitor for Analysis",
                                        competitors)
 
+    metrics = _headline_metrics(selected_competitor, seed)
     col1, col2, col3, col4 = st.columns(4)
 
     with col1:
         st.metric("Market Share",
-                  f"{random.uniform(5, 30):.1f}%",
-                  delta=f"{random.uniform(-5, 5):.1f}%")
+                  f"{metrics['market_share']:.1f}%",
+                  delta=f"{metrics['market_share_delta']:.1f}%")
     with col2:
         st.metric("Revenue Growth",
-                  f"{random.uniform(-5, 25):.1f}%",
-                  delta=f"{random.uniform(-10, 10):.1f}%")
+                  f"{metrics['revenue_growth']:.1f}%",
+                  delta=f"{metrics['revenue_growth_delta']:.1f}%")
     with col3:
         st.metric("Product Count",
-                  f"{random.randint(5, 50)}",
-                  delta=f"{random.randint(-5, 10)}")
+                  f"{metrics['product_count']}",
+                  delta=f"{metrics['product_count_delta']}")
     with col4:
         st.metric("Pricing Index",
-                  f"{random.uniform(80, 120):.1f}",
-                  delta=f"{random.uniform(-10, 10):.1f}")
+                  f"{metrics['pricing_index']:.1f}",
+                  delta=f"{metrics['pricing_index_delta']:.1f}")
+
+    _render_competitor_view(selected_competitor, seed)
 
-    tabs = st.tabs(["Market Position", "SWOT Analysis", "Growth-Share Matrix"])
 
-    with tabs[0]:
+@st.fragment
+def _render_competitor_view(selected_competitor, seed):
+    """Renders only the selected view, so switching views reruns just this fragment"""
+    view = st.radio("View",
+                    ["Market Position", "SWOT Analysis", "Growth-Share Matrix"],
+                    horizontal=True,
+                    label_visibility="collapsed",
+                    key="competitor_view")
+
+    if view == "Market Position":
         if selected_competitor != 'All Competitors':
-            render_competitor_details(selected_competitor)
+            render_competitor_details(selected_competitor, seed)
         else:
-            render_market_overview()
-    with tabs[1]:
+            render_market_overview(seed)
+    elif view == "SWOT Analysis":
         render_swot_analysis(selected_competitor)
-    with tabs[2]:
-        render_growth_share_matrix()
+    else:
+        render_growth_share_matrix(seed)
 
 
-def render_competitor_details(competitor):
+def render_competitor_details(competitor, seed):
     """Renders detailed analysis for a specific competitor"""
     col1, col2 = st.columns(2)
     with col1:
-        st.markdown(f"### {competitor} Strengths")
-        st.markdown("- Strong market presence")
-        st.markdown("- Innovative product portfolio")
-        st.markdown("- Efficient distribution network")
+        st.markdown(f"### {competitor} Strengths\n"
+                    "- Strong market presence\n"
+                    "- Innovative product portfolio\n"
+                    "- Efficient distribution network")
     with col2:
-        metrics = {
-            "Market Share": f"{random.uniform(5, 30):.1f}%",
-            "Annual Revenue": f"${random.uniform(10, 100):.1f}M",
-            "Growth Rate": f"{random.uniform(-5, 25):.1f}%",
-            "Customer Satisfaction": f"{random.uniform(3.5, 4.8):.1f}/5.0"
-        }
+        metrics = _competitor_metrics(competitor, seed)
         for key, value in metrics.items():
             st.metric(label=key, value=value)
 
 
-def render_market_overview():
-    """Renders overall market analysis"""
-    companies = [
-        'Company A', 'Company B', 'Company C', 'Company D', 'Company E'
-    ]
-    df = pd.DataFrame({
-        'Company':
-        companies,
-        'Market Share (%)': [random.uniform(5, 30) for _ in companies],
-        'Growth Rate (%)': [random.uniform(-5, 25) for _ in companies]
-    })
+@st.cache_data(ttl=3600, max_entries=32)
+def _build_market_fig(seed):
+    """Builds the market overview scatter figure for the session's data"""
+    df = _market_df(seed)
     fig = px.scatter(df,
                      x='Market Share (%)',
                      y='Growth Rate (%)',
                      text='Company',
-                     size=[30] * len(companies),
+                     size=[30] * len(df),
                      color='Company')
     fig.update_traces(textposition='top center')
-    st.plotly_chart(fig, use_container_width=True)
+    return fig
+
+
+def render_market_overview(seed):
+    """Renders overall market analysis"""
+    st.plotly_chart(_build_market_fig(seed), use_container_width=True)
 
 
 def render_swot_analysis(competitor):
@@ -97,38 +190,15 @@ def render_swot_analysis(competitor):
     st.subheader(f"SWOT Analysis: {competitor}")
     col1, col2 = st.columns(2)
     with col1:
-        st.markdown("### Strengths")
-        st.markdown("- Strong brand recognition")
-        st.markdown("- Innovative product portfolio")
-        st.markdown("- Efficient supply chain")
-        st.markdown("### Weaknesses")
-        st.markdown("- High operational costs")
-        st.markdown("- Limited market reach")
-        st.markdown("- Product gaps")
+        st.markdown(_SWOT_LEFT)
     with col2:
-        st.markdown("### Opportunities")
-        st.markdown("- Emerging markets")
-        st.markdown("- Digital transformation")
-        st.markdown("- Strategic partnerships")
-        st.markdown("### Threats")
-        st.markdown("- Intense competition")
-        st.markdown("- Regulatory changes")
-        st.markdown("- Market volatility")
+        st.markdown(_SWOT_RIGHT)
 
 
-def render_growth_share_matrix():
-    """Renders BCG growth-share matrix"""
-    st.subheader("Growth-Share Matrix Analysis")
-    products = [
-        'Product A', 'Product B', 'Product C', 'Product D', 'Product E'
-    ]
-    df = pd.DataFrame({
-        'Product':
-        products,
-        'Market Share (%)': [random.uniform(0, 50) for _ in products],
-        'Growth Rate (%)': [random.uniform(-10, 30) for _ in products],
-        'Revenue (M)': [random.uniform(10, 100) for _ in products]
-    })
+@st.cache_data(ttl=3600, max_entries=32)
+def _build_bcg_fig(seed):
+    """Builds the BCG growth-share matrix figure for the session's data"""
+    df = _bcg_df(seed)
     fig = px.scatter(df,
                      x='Market Share (%)',
                      y='Growth Rate (%)',
@@ -136,13 +206,19 @@ def render_growth_share_matrix():
                      text='Product',
                      color='Product',
                      title='BCG Growth-Share Matrix')
-    fig.add_hline(y=np.mean(df['Growth Rate (%)']),
+    fig.add_hline(y=df['Growth Rate (%)'].to_numpy().mean(),
                   line_dash="dash",
                   line_color="gray")
-    fig.add_vline(x=np.mean(df['Market Share (%)']),
+    fig.add_vline(x=df['Market Share (%)'].to_numpy().mean(),
                   line_dash="dash",
                   line_color="gray")
-    st.plotly_chart(fig, use_container_width=True)
+    return fig
+
+
+def render_growth_share_matrix(seed):
+    """Renders BCG growth-share matrix"""
+    st.subheader("Growth-Share Matrix Analysis")
+    st.plotly_chart(_build_bcg_fig(seed), use_container_width=True)
 
 
 # Run the application
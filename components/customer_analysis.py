@@ -3,8 +3,62 @@ import plotly.express as px
 import plotly.graph_objects as go
 import pandas as pd
 import numpy as np
-import random
+import re
+import time
 from datetime import datetime, timedelta
+from backend.utils import builder_rng, last_assistant_message, research_seed
+
+# Shared colour sequence for every chart on this page; px only takes as many colours as it needs
+_COLORWAY = ['#0A2540', '#00A67E', '#FF6B6B', '#FFD93D', '#6082B6', '#A9A9A9']
+
+# Sentiment colours, in the order the sentiment charts list them
+_SENTIMENT_COLORS = {'Positive': '#00A67E', 'Neutral': '#FFD93D', 'Negative': '#FF6B6B'}
+
+# Example feedback themes
+_POSITIVE_THEMES = ("Easy to use interface", "Great customer support", "Time-saving features", "Reliable performance")
+_NEGATIVE_THEMES = ("Missing advanced features", "Price is too high", "Learning curve is steep", "Limited integrations")
+
+# Segment profile card; styles for the segment-* classes live in app.py
+_SEGMENT_CARD_TEMPLATE = (
+    '<h3>{segment}</h3>'
+    '<p>Market Share</p><div class="segment-share">{share:.1f}%</div>'
+    '<div class="segment-avatar">{letter}</div>'
+    '{characteristics_html}'
+    '<p><b>Primary Target:</b> {primary}</p>'
+)
+
+# Keywords that mark a paragraph as relevant for each dashboard's insights
+_AUDIENCE_RE = re.compile(r'audience|segment|customer', re.IGNORECASE)
+_EXPECT_RE = re.compile(r'expect|need|want', re.IGNORECASE)
+
+# Upper bounds of each gap classification, used with np.digitize
+_GAP_THRESHOLDS = np.array([0.5, 1.5, 3])
+_GAP_CLASSIFICATIONS = np.array(["Minimal", "Moderate", "Significant", "Critical"], dtype=object)
+
+def _finish_bar(fig, xtitle, ytitle, height):
+    """Applies the layout shared by the bar charts: axis titles, height and a hidden colour scale"""
+    fig.layout.xaxis.title.text = xtitle
+    fig.layout.yaxis.title.text = ytitle
+    fig.layout.coloraxis.showscale = False
+    fig.layout.height = height
+    return fig
+
+def _row_percentages(counts):
+    """Converts each row of a count matrix to percentages of its row total, leaving all-zero rows at zero"""
+    totals = counts.sum(axis=1, keepdims=True)
+    return np.divide(counts * 100, totals, out=np.zeros(counts.shape), where=totals > 0)
+
+@st.fragment
+def _render_selected_view(views, seed, key):
+    """Renders only the selected view, so switching views reruns just this fragment
+    
+    Args:
+        views (dict): Maps each view label to the function that renders it
+        seed (int): The research seed passed on to the view
+        key (str): Widget key for the view selector
+    """
+    view = st.radio("View", list(views), horizontal=True, label_visibility="collapsed", key=key)
+    views[view](seed)
 
 def render_customer_analysis(mode):
     """Renders the customer analysis visualization panel
@@ -31,70 +85,69 @@ def render_audience_segmentation():
     # Create columns for metrics
     col1, col2, col3, col4 = st.columns(4)
     
-    # Generate random metrics for demonstration
+    # The metrics, tab data and figures all derive from the current research, so reruns show the same values;
+    # each draws from its own tagged stream so they are independent of one another
+    seed = research_seed(st.session_state.chat_history)
+    rng = builder_rng(seed, "audience_metrics")
+    
+    # Generate random metrics for demonstration, drawing them all in one batch
     # In a real application, these would be derived from the research results
+    market_size, customer_value, segment_count, primary_index = rng.integers([10, 50, 3, 0], [100, 500, 8, 2], endpoint=True)
+    value_delta = rng.uniform(-5, 15)
+    
     with col1:
         st.metric(
             label="Total Market Size",
-            value=f"{random.randint(10, 100)}M",
+            value=f"{market_size}M",
             delta=None
         )
     
     with col2:
         st.metric(
             label="Avg. Customer Value",
-            value=f"${random.randint(50, 500)}",
-            delta=f"{random.uniform(-5, 15):.1f}%"
+            value=f"${customer_value}",
+            delta=f"{value_delta:.1f}%"
         )
     
     with col3:
         st.metric(
             label="Segments Identified",
-            value=f"{random.randint(3, 8)}",
+            value=f"{segment_count}",
             delta=None
         )
     
     with col4:
         st.metric(
             label="Primary Segment",
-            value=f"Segment {random.choice(['A', 'B', 'C'])}",
+            value=f"Segment {'ABC'[primary_index]}",
             delta=None
         )
     
-    # Create tabs for different visualizations
-    tab1, tab2, tab3 = st.tabs(["Segment Profiles", "Demographic Analysis", "Psychographic Analysis"])
-    
-    with tab1:
-        render_segment_profiles_tab()
-    
-    with tab2:
-        render_demographic_analysis_tab()
-    
-    with tab3:
-        render_psychographic_analysis_tab()
+    # Show one visualization at a time, so only the selected one is built
+    _render_selected_view({
+        "Segment Profiles": render_segment_profiles_tab,
+        "Demographic Analysis": render_demographic_analysis_tab,
+        "Psychographic Analysis": render_psychographic_analysis_tab
+    }, seed, key="audience_view")
     
     # Segmentation insights
     st.subheader("Key Audience Insights")
     
     # Extract the last assistant message for insights
-    assistant_messages = [msg for msg in st.session_state.chat_history if msg["role"] == "assistant"]
+    last_assistant = last_assistant_message(st.session_state.chat_history)
     
-    if assistant_messages:
-        last_message = assistant_messages[-1]["content"]
+    if last_assistant:
+        last_message = last_assistant["content"]
         
         # Take a relevant paragraph as insights
         paragraphs = last_message.split('\n\n')
-        audience_paragraphs = [p for p in paragraphs if "audience" in p.lower() or "segment" in p.lower() or "customer" in p.lower()]
-        if audience_paragraphs:
-            insights = audience_paragraphs[0]
-        else:
-            insights = paragraphs[0] if paragraphs else last_message
+        insights = next((p for p in paragraphs if _AUDIENCE_RE.search(p)), paragraphs[0] if paragraphs else last_message)
         
         st.write(insights)
     else:
         st.write("No audience segmentation insights available yet. Ask a question to generate insights.")
 
-def render_segment_profiles_tab():
+def render_segment_profiles_tab(seed):
     """Renders the customer segment profiles visualization tab"""
     st.subheader("Customer Segment Profiles")
     
@@ -116,68 +169,53 @@ def render_segment_profiles_tab():
         'Price Sensitivity': ['Low', 'Medium', 'High', 'Medium-High']
     }
     
-    # Generate random segment sizes
-    segment_sizes = [random.uniform(15, 40) for _ in range(len(segments))]
-    total = sum(segment_sizes)
-    segment_percentages = [size * 100 / total for size in segment_sizes]
+    segment_percentages, fig = _build_segment_profiles(seed, tuple(segments))
     
-    # Display each segment in its column
+    # Display each segment in its column, rendering the whole card with a single markdown call
     for i, (col, segment) in enumerate(zip(cols, segments)):
+        characteristics_html = "".join(f"<p><b>{key}:</b> {values[i]}</p>" for key, values in characteristics.items())
+        card_html = _SEGMENT_CARD_TEMPLATE.format_map({
+            'segment': segment,
+            'share': segment_percentages[i],
+            'letter': segment[0],
+            'characteristics_html': characteristics_html,
+            'primary': "✅" if i == 0 else "❌"
+        })
         with col:
             with st.container(border=True):
-                st.subheader(segment)
-                st.metric(
-                    label="Market Share",
-                    value=f"{segment_percentages[i]:.1f}%"
-                )
-                
-                # Segment avatar/image placeholder
-                st.markdown(f"""
-                <div style="background-color:#f0f2f6; border-radius:50%; width:100px; height:100px; 
-                display:flex; align-items:center; justify-content:center; margin:0 auto; font-size:24px; 
-                color:#0A2540; font-weight:bold;">
-                {segment[0]}
-                </div>
-                """, unsafe_allow_html=True)
-                
-                # Segment characteristics
-                for key, values in characteristics.items():
-                    st.markdown(f"**{key}:** {values[i]}")
-                
-                # Randomly determine if this is a primary segment
-                is_primary = i == 0
-                if is_primary:
-                    st.markdown("**Primary Target:** ✅")
-                else:
-                    st.markdown("**Primary Target:** ❌")
+                st.markdown(card_html, unsafe_allow_html=True)
     
     # Comparative segment analysis
     st.subheader("Comparative Segment Analysis")
     
+    st.plotly_chart(fig, use_container_width=True)
+
+@st.cache_data(ttl=3600, max_entries=32)
+def _build_segment_profiles(seed, segments):
+    """Generates the segment market shares and the comparative radar chart"""
+    rng = builder_rng(seed, "segment_profiles")
+    
+    # Generate random segment sizes
+    segment_sizes = rng.uniform(15, 40, len(segments)).astype(np.float32)
+    segment_percentages = segment_sizes * 100 / segment_sizes.sum()
+    
     # Create example data for radar chart comparing segments
     categories = ['Purchasing Power', 'Brand Loyalty', 'Social Media Activity', 'Product Knowledge', 'Influence']
     
-    # Generate random ratings for each segment and category
-    segment_ratings = {}
-    for segment in segments:
-        segment_ratings[segment] = [random.uniform(1, 10) for _ in range(len(categories))]
-    
-    # Create a DataFrame for the radar chart
-    df_radar = pd.DataFrame()
-    for segment in segments:
-        segment_df = pd.DataFrame({
-            'Segment': [segment] * len(categories),
-            'Category': categories,
-            'Rating': segment_ratings[segment]
-        })
-        df_radar = pd.concat([df_radar, segment_df])
+    # Draw a random rating for each segment and category, one row per segment
+    ratings = rng.uniform(1, 10, (len(segments), len(categories))).astype(np.float32)
     
-    # Create and display radar chart
-    fig = px.line_polar(
-        df_radar, r='Rating', theta='Category', color='Segment', line_close=True,
-        range_r=[0, 10],
-        color_discrete_sequence=['#0A2540', '#00A67E', '#FF6B6B', '#FFD93D']
-    )
+    # Create radar chart with one closed trace per segment, repeating the first point to close each line
+    closed_categories = categories + categories[:1]
+    fig = go.Figure()
+    for segment, segment_ratings, color in zip(segments, ratings, _COLORWAY):
+        fig.add_trace(go.Scatterpolar(
+            r=np.append(segment_ratings, segment_ratings[0]),
+            theta=closed_categories,
+            mode='lines',
+            name=segment,
+            line_color=color
+        ))
     
     fig.update_layout(
         polar=dict(
@@ -190,101 +228,98 @@ def render_segment_profiles_tab():
         height=500
     )
     
-    st.plotly_chart(fig, use_container_width=True)
+    return segment_percentages, fig
 
-def render_demographic_analysis_tab():
+def render_demographic_analysis_tab(seed):
     """Renders the demographic analysis visualization tab"""
     st.subheader("Demographic Analysis")
     
+    age_fig, income_fig, geo_fig, location_fig = _build_demographic_figures(seed)
+    
     # Create columns for different demographic visualizations
     col1, col2 = st.columns(2)
     
     with col1:
         # Age distribution
         st.subheader("Age Distribution")
-        
-        # Example age data
-        age_groups = ['18-24', '25-34', '35-44', '45-54', '55-64', '65+']
-        age_distribution = [random.uniform(5, 25) for _ in range(len(age_groups))]
-        
-        # Normalize to 100%
-        total = sum(age_distribution)
-        age_distribution = [val * 100 / total for val in age_distribution]
-        
-        # Create DataFrame
-        age_df = pd.DataFrame({
-            'Age Group': age_groups,
-            'Percentage': age_distribution
-        })
-        
-        # Create bar chart
-        fig1 = px.bar(
-            age_df,
-            x='Age Group',
-            y='Percentage',
-            text_auto='.1f',
-            labels={'Percentage': 'Percentage (%)'},
-            color='Percentage',
-            color_continuous_scale='Blues'
-        )
-        
-        fig1.update_layout(
-            xaxis=dict(title='Age Group'),
-            yaxis=dict(title='Percentage (%)'),
-            coloraxis_showscale=False,
-            height=350
-        )
-        
-        st.plotly_chart(fig1, use_container_width=True)
+        st.plotly_chart(age_fig, use_container_width=True)
     
     with col2:
         # Income distribution
         st.subheader("Income Distribution")
-        
-        # Example income data
-        income_groups = ['Under $25k', '$25k-$50k', '$50k-$75k', '$75k-$100k', '$100k+']
-        income_distribution = [random.uniform(5, 30) for _ in range(len(income_groups))]
-        
-        # Normalize to 100%
-        total = sum(income_distribution)
-        income_distribution = [val * 100 / total for val in income_distribution]
-        
-        # Create DataFrame
-        income_df = pd.DataFrame({
-            'Income Group': income_groups,
-            'Percentage': income_distribution
-        })
-        
-        # Create bar chart
-        fig2 = px.bar(
-            income_df,
-            x='Income Group',
-            y='Percentage',
-            text_auto='.1f',
-            labels={'Percentage': 'Percentage (%)'},
-            color='Percentage',
-            color_continuous_scale='Greens'
-        )
-        
-        fig2.update_layout(
-            xaxis=dict(title='Income Group'),
-            yaxis=dict(title='Percentage (%)'),
-            coloraxis_showscale=False,
-            height=350
-        )
-        
-        st.plotly_chart(fig2, use_container_width=True)
+        st.plotly_chart(income_fig, use_container_width=True)
     
     # Geographic distribution
     st.subheader("Geographic Distribution")
+    st.plotly_chart(geo_fig, use_container_width=True)
+    
+    # Urban vs. Suburban vs. Rural
+    st.subheader("Urban vs. Suburban vs. Rural")
+    st.plotly_chart(location_fig, use_container_width=True)
+
+@st.cache_data(ttl=3600, max_entries=32)
+def _build_demographic_figures(seed):
+    """Generates the age, income, geographic and location figures"""
+    rng = builder_rng(seed, "demographics")
+    
+    # Example age data
+    age_groups = ['18-24', '25-34', '35-44', '45-54', '55-64', '65+']
+    age_distribution = rng.uniform(5, 25, len(age_groups)).astype(np.float32)
+    
+    # Normalize to 100%
+    age_distribution *= 100 / age_distribution.sum()
+    
+    # Create DataFrame
+    age_df = pd.DataFrame({
+        'Age Group': age_groups,
+        'Percentage': age_distribution
+    })
+    
+    # Create bar chart
+    fig1 = px.bar(
+        age_df,
+        x='Age Group',
+        y='Percentage',
+        text_auto='.1f',
+        labels={'Percentage': 'Percentage (%)'},
+        color='Percentage',
+        color_continuous_scale='Blues'
+    )
+    
+    _finish_bar(fig1, 'Age Group', 'Percentage (%)', 350)
+    
+    # Example income data
+    income_groups = ['Under $25k', '$25k-$50k', '$50k-$75k', '$75k-$100k', '$100k+']
+    income_distribution = rng.uniform(5, 30, len(income_groups)).astype(np.float32)
+    
+    # Normalize to 100%
+    income_distribution *= 100 / income_distribution.sum()
+    
+    # Create DataFrame
+    income_df = pd.DataFrame({
+        'Income Group': income_groups,
+        'Percentage': income_distribution
+    })
+    
+    # Create bar chart
+    fig2 = px.bar(
+        income_df,
+        x='Income Group',
+        y='Percentage',
+        text_auto='.1f',
+        labels={'Percentage': 'Percentage (%)'},
+        color='Percentage',
+        color_continuous_scale='Greens'
+    )
+    
+    _finish_bar(fig2, 'Income Group', 'Percentage (%)', 350)
     
     # Example geographic data
     regions = ['North America', 'Europe', 'Asia Pacific', 'Latin America', 'Middle East & Africa']
-    geo_distribution = [random.uniform(10, 40) for _ in range(len(regions))]
+    geo_distribution = rng.uniform(10, 40, len(regions)).astype(np.float32)
     
     # Normalize to 100%
-    total = sum(geo_distribution)
-    geo_distribution = [val * 100 / total for val in geo_distribution]
+    geo_distribution *= 100 / geo_distribution.sum()
     
     # Create DataFrame
     geo_df = pd.DataFrame({
@@ -298,7 +333,7 @@ def render_demographic_analysis_tab():
         values='Percentage',
         names='Region',
         hole=0.4,
-        color_discrete_sequence=['#0A2540', '#00A67E', '#FF6B6B', '#FFD93D', '#6082B6']
+        color_discrete_sequence=_COLORWAY
     )
     
     fig3.update_traces(textposition='inside', textinfo='percent+label')
@@ -308,18 +343,12 @@ def render_demographic_analysis_tab():
         height=400
     )
     
-    st.plotly_chart(fig3, use_container_width=True)
-    
-    # Urban vs. Suburban vs. Rural
-    st.subheader("Urban vs. Suburban vs. Rural")
-    
     # Example data
     location_types = ['Urban', 'Suburban', 'Rural']
-    location_distribution = [random.uniform(20, 50) for _ in range(len(location_types))]
+    location_distribution = rng.uniform(20, 50, len(location_types)).astype(np.float32)
     
     # Normalize to 100%
-    total = sum(location_distribution)
-    location_distribution = [val * 100 / total for val in location_distribution]
+    location_distribution *= 100 / location_distribution.sum()
     
     # Create DataFrame
     location_df = pd.DataFrame({
@@ -333,7 +362,7 @@ def render_demographic_analysis_tab():
         values='Percentage',
         names='Location Type',
         hole=0.6,
-        color_discrete_sequence=['#0A2540', '#00A67E', '#FF6B6B']
+        color_discrete_sequence=_COLORWAY
     )
     
     fig4.update_traces(textposition='inside', textinfo='percent+label')
@@ -342,89 +371,26 @@ def render_demographic_analysis_tab():
         height=300
     )
     
-    st.plotly_chart(fig4, use_container_width=True)
+    return fig1, fig2, fig3, fig4
 
-def render_psychographic_analysis_tab():
+def render_psychographic_analysis_tab(seed):
     """Renders the psychographic analysis visualization tab"""
     st.subheader("Psychographic Analysis")
     
+    values_fig, lifestyle_fig, drivers_fig, channels_fig, social_fig = _build_psychographic_figures(seed)
+    
     # Create columns for different psychographic visualizations
     col1, col2 = st.columns(2)
     
     with col1:
         # Values and Interests
         st.subheader("Values & Interests")
-        
-        # Example values data
-        values = ['Innovation', 'Tradition', 'Community', 'Achievement', 'Self-expression', 'Security']
-        value_scores = [random.uniform(1, 10) for _ in range(len(values))]
-        
-        # Create DataFrame
-        values_df = pd.DataFrame({
-            'Value': values,
-            'Score': value_scores
-        })
-        
-        # Sort by score
-        values_df = values_df.sort_values('Score', ascending=False)
-        
-        # Create horizontal bar chart
-        fig1 = px.bar(
-            values_df,
-            y='Value',
-            x='Score',
-            orientation='h',
-            color='Score',
-            color_continuous_scale='Blues',
-            text_auto='.1f'
-        )
-        
-        fig1.update_layout(
-            xaxis=dict(title='Importance Score (1-10)'),
-            yaxis=dict(title=''),
-            coloraxis_showscale=False,
-            height=400
-        )
-        
-        st.plotly_chart(fig1, use_container_width=True)
+        st.plotly_chart(values_fig, use_container_width=True)
     
     with col2:
         # Lifestyle Factors
         st.subheader("Lifestyle Factors")
-        
-        # Example lifestyle data
-        lifestyles = ['Tech-savvy', 'Fitness-oriented', 'Environmentally conscious', 
-                       'Family-focused', 'Career-driven', 'Travel enthusiast']
-        lifestyle_scores = [random.uniform(1, 10) for _ in range(len(lifestyles))]
-        
-        # Create DataFrame
-        lifestyle_df = pd.DataFrame({
-            'Lifestyle': lifestyles,
-            'Score': lifestyle_scores
-        })
-        
-        # Sort by score
-        lifestyle_df = lifestyle_df.sort_values('Score', ascending=False)
-        
-        # Create horizontal bar chart
-        fig2 = px.bar(
-            lifestyle_df,
-            y='Lifestyle',
-            x='Score',
-            orientation='h',
-            color='Score',
-            color_continuous_scale='Greens',
-            text_auto='.1f'
-        )
-        
-        fig2.update_layout(
-            xaxis=dict(title='Prevalence Score (1-10)'),
-            yaxis=dict(title=''),
-            coloraxis_showscale=False,
-            height=400
-        )
-        
-        st.plotly_chart(fig2, use_container_width=True)
+        st.plotly_chart(lifestyle_fig, use_container_width=True)
     
     # Buying Behavior Analysis
     st.subheader("Buying Behavior Analysis")
@@ -435,77 +401,128 @@ def render_psychographic_analysis_tab():
     with col3:
         # Purchase Drivers
         st.subheader("Purchase Drivers")
-        
-        # Example purchase drivers
-        drivers = ['Price', 'Quality', 'Brand Reputation', 'Convenience', 'Features/Technology', 'Customer Service']
-        driver_scores = [random.uniform(1, 10) for _ in range(len(drivers))]
-        
-        # Create DataFrame
-        drivers_df = pd.DataFrame({
-            'Driver': drivers,
-            'Importance': driver_scores
-        })
-        
-        # Create radar chart
-        fig3 = px.line_polar(
-            drivers_df, r='Importance', theta='Driver', line_close=True,
-            range_r=[0, 10],
-            color_discrete_sequence=['#0A2540']
-        )
-        
-        fig3.update_layout(
-            polar=dict(
-                radialaxis=dict(
-                    visible=True,
-                    range=[0, 10]
-                )
-            ),
-            showlegend=False,
-            height=400
-        )
-        
-        st.plotly_chart(fig3, use_container_width=True)
+        st.plotly_chart(drivers_fig, use_container_width=True)
     
     with col4:
         # Channel Preferences
         st.subheader("Channel Preferences")
-        
-        # Example channel data
-        channels = ['Online / E-commerce', 'Retail Stores', 'Mobile Apps', 'Social Commerce', 'Marketplace', 'Direct Sales']
-        channel_percentages = [random.uniform(5, 30) for _ in range(len(channels))]
-        
-        # Normalize to 100%
-        total = sum(channel_percentages)
-        channel_percentages = [val * 100 / total for val in channel_percentages]
-        
-        # Create DataFrame
-        channels_df = pd.DataFrame({
-            'Channel': channels,
-            'Percentage': channel_percentages
-        })
-        
-        # Create pie chart
-        fig4 = px.pie(
-            channels_df,
-            values='Percentage',
-            names='Channel',
-            color_discrete_sequence=['#0A2540', '#00A67E', '#FF6B6B', '#FFD93D', '#6082B6', '#A9A9A9']
-        )
-        
-        fig4.update_traces(textposition='inside', textinfo='percent+label')
-        
-        fig4.update_layout(
-            height=400
-        )
-        
-        st.plotly_chart(fig4, use_container_width=True)
+        st.plotly_chart(channels_fig, use_container_width=True)
     
     # Social Media Platform Usage
     st.subheader("Social Media Platform Usage")
+    st.plotly_chart(social_fig, use_container_width=True)
+
+@st.cache_data(ttl=3600, max_entries=32)
+def _build_psychographic_figures(seed):
+    """Generates the values, lifestyle, purchase driver, channel and social media figures"""
+    rng = builder_rng(seed, "psychographics")
+    
+    # Example values data
+    values = ['Innovation', 'Tradition', 'Community', 'Achievement', 'Self-expression', 'Security']
+    value_scores = rng.uniform(1, 10, len(values)).astype(np.float32)
+    
+    # Create DataFrame
+    values_df = pd.DataFrame({
+        'Value': values,
+        'Score': value_scores
+    })
+    
+    # Sort by score
+    values_df = values_df.sort_values('Score', ascending=False)
+    
+    # Create horizontal bar chart
+    fig1 = px.bar(
+        values_df,
+        y='Value',
+        x='Score',
+        orientation='h',
+        color='Score',
+        color_continuous_scale='Blues',
+        text_auto='.1f'
+    )
+    
+    _finish_bar(fig1, 'Importance Score (1-10)', '', 400)
+    
+    # Example lifestyle data
+    lifestyles = ['Tech-savvy', 'Fitness-oriented', 'Environmentally conscious', 
+                   'Family-focused', 'Career-driven', 'Travel enthusiast']
+    lifestyle_scores = rng.uniform(1, 10, len(lifestyles)).astype(np.float32)
+    
+    # Create DataFrame
+    lifestyle_df = pd.DataFrame({
+        'Lifestyle': lifestyles,
+        'Score': lifestyle_scores
+    })
+    
+    # Sort by score
+    lifestyle_df = lifestyle_df.sort_values('Score', ascending=False)
+    
+    # Create horizontal bar chart
+    fig2 = px.bar(
+        lifestyle_df,
+        y='Lifestyle',
+        x='Score',
+        orientation='h',
+        color='Score',
+        color_continuous_scale='Greens',
+        text_auto='.1f'
+    )
+    
+    _finish_bar(fig2, 'Prevalence Score (1-10)', '', 400)
+    
+    # Example purchase drivers
+    drivers = ['Price', 'Quality', 'Brand Reputation', 'Convenience', 'Features/Technology', 'Customer Service']
+    driver_scores = rng.uniform(1, 10, len(drivers)).astype(np.float32)
+    
+    # Create radar chart straight from the arrays, repeating the first point to close the line
+    fig3 = go.Figure(go.Scatterpolar(
+        r=np.append(driver_scores, driver_scores[0]),
+        theta=drivers + drivers[:1],
+        mode='lines',
+        line_color=_COLORWAY[0]
+    ))
+    
+    fig3.update_layout(
+        polar=dict(
+            radialaxis=dict(
+                visible=True,
+                range=[0, 10]
+            )
+        ),
+        showlegend=False,
+        height=400
+    )
+    
+    # Example channel data
+    channels = ['Online / E-commerce', 'Retail Stores', 'Mobile Apps', 'Social Commerce', 'Marketplace', 'Direct Sales']
+    channel_percentages = rng.uniform(5, 30, len(channels)).astype(np.float32)
+    
+    # Normalize to 100%
+    channel_percentages *= 100 / channel_percentages.sum()
+    
+    # Create DataFrame
+    channels_df = pd.DataFrame({
+        'Channel': channels,
+        'Percentage': channel_percentages
+    })
+    
+    # Create pie chart
+    fig4 = px.pie(
+        channels_df,
+        values='Percentage',
+        names='Channel',
+        color_discrete_sequence=_COLORWAY
+    )
+    
+    fig4.update_traces(textposition='inside', textinfo='percent+label')
+    
+    fig4.update_layout(
+        height=400
+    )
     
     # Example social media data
     platforms = ['Facebook', 'Instagram', 'TikTok', 'Twitter', 'LinkedIn', 'YouTube', 'Pinterest', 'Reddit']
-    platform_usage = [random.uniform(10, 80) for _ in range(len(platforms))]
+    platform_usage = rng.uniform(10, 80, len(platforms)).astype(np.float32)
     
     # Create DataFrame
     social_df = pd.DataFrame({
@@ -526,14 +543,9 @@ def render_psychographic_analysis_tab():
         text_auto='.1f'
     )
     
-    fig5.update_layout(
-        xaxis=dict(title='Platform'),
-        yaxis=dict(title='Usage (%)'),
-        coloraxis_showscale=False,
-        height=400
-    )
+    _finish_bar(fig5, 'Platform', 'Usage (%)', 400)
     
-    st.plotly_chart(fig5, use_container_width=True)
+    return fig1, fig2, fig3, fig4, fig5
 
 def render_customer_expectations():
     """Renders the customer expectations analysis"""
@@ -546,73 +558,101 @@ def render_customer_expectations():
     # Create columns for metrics
     col1, col2, col3, col4 = st.columns(4)
     
-    # Generate random metrics for demonstration
+    # The metrics, tab data and figures all derive from the current research, so reruns show the same values;
+    # each draws from its own tagged stream so they are independent of one another
+    seed = research_seed(st.session_state.chat_history)
+    rng = builder_rng(seed, "expectations_metrics")
+    
+    # Generate random metrics for demonstration, drawing them all in one batch
     # In a real application, these would be derived from the research results
+    satisfaction, satisfaction_delta, nps_delta = rng.uniform([7, -1, -10], [9.5, 1, 10])
+    unmet_needs, feature_requests, requests_delta, nps = rng.integers([3, 10, 1, 20], [8, 50, 10, 70], endpoint=True)
+    
     with col1:
         st.metric(
             label="Satisfaction Score",
-            value=f"{random.uniform(7, 9.5):.1f}/10",
-            delta=f"{random.uniform(-1, 1):.1f}"
+            value=f"{satisfaction:.1f}/10",
+            delta=f"{satisfaction_delta:.1f}"
         )
     
     with col2:
         st.metric(
             label="Unmet Needs",
-            value=f"{random.randint(3, 8)}",
+            value=f"{unmet_needs}",
             delta=None
         )
     
     with col3:
         st.metric(
             label="Feature Requests",
-            value=f"{random.randint(10, 50)}",
-            delta=f"{random.randint(1, 10)}"
+            value=f"{feature_requests}",
+            delta=f"{requests_delta}"
         )
     
     with col4:
         st.metric(
             label="NPS",
-            value=f"{random.randint(20, 70)}",
-            delta=f"{random.uniform(-10, 10):.1f}"
+            value=f"{nps}",
+            delta=f"{nps_delta:.1f}"
         )
     
-    # Create tabs for different visualizations
-    tab1, tab2, tab3 = st.tabs(["Feature Demand", "Expectations Gap", "Satisfaction Analysis"])
-    
-    with tab1:
-        render_feature_demand_tab()
-    
-    with tab2:
-        render_expectations_gap_tab()
-    
-    with tab3:
-        render_satisfaction_analysis_tab()
+    # Show one visualization at a time, so only the selected one is built
+    _render_selected_view({
+        "Feature Demand": render_feature_demand_tab,
+        "Expectations Gap": render_expectations_gap_tab,
+        "Satisfaction Analysis": render_satisfaction_analysis_tab
+    }, seed, key="expectations_view")
     
     # Expectations insights
     st.subheader("Customer Expectations Insights")
     
     # Extract the last assistant message for insights
-    assistant_messages = [msg for msg in st.session_state.chat_history if msg["role"] == "assistant"]
+    last_assistant = last_assistant_message(st.session_state.chat_history)
     
-    if assistant_messages:
-        last_message = assistant_messages[-1]["content"]
+    if last_assistant:
+        last_message = last_assistant["content"]
         
         # Take a relevant paragraph as insights
         paragraphs = last_message.split('\n\n')
-        expectation_paragraphs = [p for p in paragraphs if "expect" in p.lower() or "need" in p.lower() or "want" in p.lower()]
-        if expectation_paragraphs:
-            insights = expectation_paragraphs[0]
-        else:
-            insights = paragraphs[0] if paragraphs else last_message
+        insights = next((p for p in paragraphs if _EXPECT_RE.search(p)), paragraphs[0] if paragraphs else last_message)
         
         st.write(insights)
     else:
         st.write("No customer expectations insights available yet. Ask a question to generate insights.")
 
-def render_feature_demand_tab():
+def render_feature_demand_tab(seed):
     """Renders the feature demand visualization tab"""
     st.subheader("Feature Demand Analysis")
     
+    fig, feature_df = _build_feature_demand(seed)
+    
+    st.plotly_chart(fig, use_container_width=True)
+    
+    # Top requested features table
+    st.subheader("Top Requested Features")
+    
+    # Display top 5 features by demand, partitioning out the top rows before sorting just those
+    demand = feature_df['Demand Score'].to_numpy()
+    top_idx = np.argpartition(-demand, min(5, len(demand)) - 1)[:5]
+    top_features = feature_df.iloc[top_idx[np.argsort(-demand[top_idx])]]
+    
+    # Display table, leaving the scores numeric and formatting them in the browser
+    st.dataframe(
+        top_features,
+        use_container_width=True,
+        column_order=['Feature', 'Demand Score', 'Development Complexity', 'Priority Score'],
+        column_config={
+            'Demand Score': st.column_config.NumberColumn(format="%.1f/10"),
+            'Development Complexity': st.column_config.NumberColumn(format="%.1f/10"),
+            'Priority Score': st.column_config.NumberColumn(format="%.2f")
+        }
+    )
+
+@st.cache_data(ttl=3600, max_entries=32)
+def _build_feature_demand(seed):
+    """Generates the feature demand data and the prioritization matrix"""
+    rng = builder_rng(seed, "feature_demand")
+    
     # Example feature demand data
     features = [
         "Advanced Analytics", "Mobile Integration", "Social Sharing", 
@@ -621,11 +661,11 @@ def render_feature_demand_tab():
         "Integration with Other Tools"
     ]
     
-    demand_scores = [random.uniform(1, 10) for _ in range(len(features))]
-    development_complexity = [random.uniform(1, 10) for _ in range(len(features))]
+    demand_scores = rng.uniform(1, 10, len(features)).astype(np.float32)
+    development_complexity = rng.uniform(1, 10, len(features)).astype(np.float32)
     
     # Calculate priority score (demand / complexity)
-    priority_scores = [demand_scores[i] / development_complexity[i] * 3 for i in range(len(features))]
+    priority_scores = demand_scores / development_complexity * 3
     
     # Create DataFrame
     feature_df = pd.DataFrame({
@@ -635,8 +675,8 @@ def render_feature_demand_tab():
         'Priority Score': priority_scores
     })
     
-    # Sort by priority score
-    feature_df = feature_df.sort_values('Priority Score', ascending=False)
+    # Sort by priority score using the raw array
+    feature_df = feature_df.iloc[np.argsort(-priority_scores)]
     
     # Create scatter plot
     fig = px.scatter(
@@ -680,111 +720,33 @@ def render_feature_demand_tab():
         height=600
     )
     
-    st.plotly_chart(fig, use_container_width=True)
-    
-    # Top requested features table
-    st.subheader("Top Requested Features")
-    
-    # Display top 5 features by demand
-    top_features = feature_df.sort_values('Demand Score', ascending=False).head(5)
-    
-    # Format table
-    formatted_top_features = top_features.copy()
-    formatted_top_features['Demand Score'] = formatted_top_features['Demand Score'].apply(lambda x: f"{x:.1f}/10")
-    formatted_top_features['Development Complexity'] = formatted_top_features['Development Complexity'].apply(lambda x: f"{x:.1f}/10")
-    formatted_top_features['Priority Score'] = formatted_top_features['Priority Score'].apply(lambda x: f"{x:.2f}")
-    
-    # Display table
-    st.dataframe(
-        formatted_top_features[['Feature', 'Demand Score', 'Development Complexity', 'Priority Score']],
-        use_container_width=True
-    )
+    return fig, feature_df
 
-def render_expectations_gap_tab():
+def render_expectations_gap_tab(seed):
     """Renders the expectations gap visualization tab"""
     st.subheader("Expectations vs. Reality Gap Analysis")
     
-    # Example dimensions to measure
-    dimensions = [
-        "Ease of Use", "Customer Support", "Feature Set", "Performance/Speed",
-        "Reliability", "Value for Money", "Design/UI", "Integration Capabilities"
-    ]
-    
-    # Generate random scores for customer expectations and current reality
-    expectation_scores = [random.uniform(7, 10) for _ in range(len(dimensions))]
-    reality_scores = [random.uniform(3, 9.5) for _ in range(len(dimensions))]
-    
-    # Calculate gaps
-    gaps = [expectation_scores[i] - reality_scores[i] for i in range(len(dimensions))]
-    
-    # Create DataFrame
-    gap_df = pd.DataFrame({
-        'Dimension': dimensions,
-        'Expected': expectation_scores,
-        'Reality': reality_scores,
-        'Gap': gaps
-    })
-    
-    # Sort by gap size
-    gap_df = gap_df.sort_values('Gap', ascending=False)
-    
-    # Create a bar chart showing expectations vs. reality
-    fig = go.Figure()
-    
-    fig.add_trace(go.Bar(
-        y=gap_df['Dimension'],
-        x=gap_df['Expected'],
-        name='Expected',
-        orientation='h',
-        marker_color='#0A2540'
-    ))
-    
-    fig.add_trace(go.Bar(
-        y=gap_df['Dimension'],
-        x=gap_df['Reality'],
-        name='Reality',
-        orientation='h',
-        marker_color='#00A67E'
-    ))
-    
-    # Update layout
-    fig.update_layout(
-        title='Customer Expectations vs. Reality',
-        xaxis=dict(title='Score (0-10)'),
-        yaxis=dict(title=''),
-        barmode='overlay',
-        legend=dict(orientation='h', yanchor='bottom', y=1.02, xanchor='right', x=1),
-        height=500
-    )
+    fig, gap_df = _build_expectations_gap(seed)
     
     st.plotly_chart(fig, use_container_width=True)
     
     # Display gap analysis table
     st.subheader("Expectations Gap Analysis")
     
-    # Format table
-    formatted_gap_df = gap_df.copy()
-    formatted_gap_df['Expected'] = formatted_gap_df['Expected'].apply(lambda x: f"{x:.1f}")
-    formatted_gap_df['Reality'] = formatted_gap_df['Reality'].apply(lambda x: f"{x:.1f}")
-    formatted_gap_df['Gap'] = formatted_gap_df['Gap'].apply(lambda x: f"{x:.1f}")
-    
-    # Add gap classification
-    def classify_gap(gap):
-        if gap > 3:
-            return "Critical"
-        elif gap > 1.5:
-            return "Significant"
-        elif gap > 0.5:
-            return "Moderate"
-        else:
-            return "Minimal"
-    
-    formatted_gap_df['Classification'] = gap_df['Gap'].apply(classify_gap)
-    
-    # Display table
+    # Add gap classification (gaps above 0.5, 1.5 and 3 are Moderate, Significant and Critical)
+    gap_classes = np.digitize(gap_df['Gap'].to_numpy(), _GAP_THRESHOLDS, right=True)
+    gap_df['Classification'] = _GAP_CLASSIFICATIONS[gap_classes]
+    
+    # Display table, leaving the scores numeric and formatting them in the browser
     st.dataframe(
-        formatted_gap_df[['Dimension', 'Expected', 'Reality', 'Gap', 'Classification']],
-        use_container_width=True
+        gap_df,
+        use_container_width=True,
+        column_order=['Dimension', 'Expected', 'Reality', 'Gap', 'Classification'],
+        column_config={
+            'Expected': st.column_config.NumberColumn(format="%.1f"),
+            'Reality': st.column_config.NumberColumn(format="%.1f"),
+            'Gap': st.column_config.NumberColumn(format="%.1f")
+        }
     )
     
     # Display action recommendations for top gaps
@@ -837,35 +799,109 @@ def render_expectations_gap_tab():
                     st.markdown("- Benchmark against industry leaders to identify improvement areas")
                     st.markdown("- Develop specific metrics to track improvements")
 
-def render_satisfaction_analysis_tab():
-    """Renders the satisfaction analysis visualization tab"""
-    st.subheader("Customer Satisfaction Analysis")
+@st.cache_data(ttl=3600, max_entries=32)
+def _build_expectations_gap(seed):
+    """Generates the expectations gap data, sorted by gap size, and the comparison chart"""
+    rng = builder_rng(seed, "expectations_gap")
     
-    # Example time-series data for satisfaction trends
-    months = pd.date_range(end=datetime.now(), periods=12, freq='ME')
-    csat_scores = [random.uniform(7, 9) for _ in range(len(months))]
-    nps_scores = [random.uniform(30, 70) for _ in range(len(months))]
+    # Example dimensions to measure
+    dimensions = [
+        "Ease of Use", "Customer Support", "Feature Set", "Performance/Speed",
+        "Reliability", "Value for Money", "Design/UI", "Integration Capabilities"
+    ]
+    
+    # Generate random scores for customer expectations and current reality
+    expectation_scores = rng.uniform(7, 10, len(dimensions)).astype(np.float32)
+    reality_scores = rng.uniform(3, 9.5, len(dimensions)).astype(np.float32)
+    
+    # Calculate gaps
+    gaps = expectation_scores - reality_scores
     
     # Create DataFrame
-    satisfaction_df = pd.DataFrame({
-        'Date': months,
-        'CSAT Score': csat_scores,
-        'NPS': nps_scores
+    gap_df = pd.DataFrame({
+        'Dimension': dimensions,
+        'Expected': expectation_scores,
+        'Reality': reality_scores,
+        'Gap': gaps
     })
     
+    # Sort by gap size
+    gap_df = gap_df.sort_values('Gap', ascending=False)
+    
+    # Create a bar chart showing expectations vs. reality from the long-format scores
+    melted = gap_df.melt(id_vars='Dimension', value_vars=['Expected', 'Reality'], var_name='Type', value_name='Score')
+    fig = px.bar(
+        melted,
+        x='Score',
+        y='Dimension',
+        color='Type',
+        orientation='h',
+        barmode='overlay',
+        title='Customer Expectations vs. Reality',
+        labels={'Score': 'Score (0-10)', 'Dimension': '', 'Type': ''},
+        color_discrete_map={'Expected': '#0A2540', 'Reality': '#00A67E'},
+        height=500
+    )
+    
+    fig.update_layout(legend=dict(orientation='h', yanchor='bottom', y=1.02, xanchor='right', x=1))
+    
+    return fig, gap_df
+
+def render_satisfaction_analysis_tab(seed):
+    """Renders the satisfaction analysis visualization tab"""
+    st.subheader("Customer Satisfaction Analysis")
+    
+    # Key the trend on the current hour so its month index only moves once the cache entry expires
+    trend_fig, sentiment_fig, topic_fig = _build_satisfaction_figures(seed, int(time.time() // 3600))
+    
+    st.plotly_chart(trend_fig, use_container_width=True)
+    
+    # Customer feedback sentiment analysis
+    st.subheader("Feedback Sentiment Analysis")
+    
+    col1, col2 = st.columns([1, 2])
+    
+    with col1:
+        st.plotly_chart(sentiment_fig, use_container_width=True)
+    
+    with col2:
+        st.plotly_chart(topic_fig, use_container_width=True)
+    
+    # Common feedback themes
+    st.subheader("Common Feedback Themes")
+    
+    col3, col4 = st.columns(2)
+    
+    # Each column is a single markdown block: heading plus numbered themes
+    with col3:
+        st.markdown("### Positive Themes\n\n" + "\n\n".join(f"**{i+1}.** {theme}" for i, theme in enumerate(_POSITIVE_THEMES)))
+    
+    with col4:
+        st.markdown("### Areas for Improvement\n\n" + "\n\n".join(f"**{i+1}.** {theme}" for i, theme in enumerate(_NEGATIVE_THEMES)))
+
+@st.cache_data(ttl=3600, max_entries=32)
+def _build_satisfaction_figures(seed, hour_bucket):
+    """Generates the satisfaction trend, sentiment split and sentiment-by-topic figures"""
+    rng = builder_rng(seed, "satisfaction")
+    
+    # Example time-series data for satisfaction trends
+    months = pd.date_range(end=datetime.fromtimestamp(hour_bucket * 3600), periods=12, freq='ME')
+    csat_scores = rng.uniform(7, 9, len(months)).astype(np.float32)
+    nps_scores = rng.uniform(30, 70, len(months)).astype(np.float32)
+    
     # Create line chart with dual y-axis
     fig = go.Figure()
     
     fig.add_trace(go.Scatter(
-        x=satisfaction_df['Date'],
-        y=satisfaction_df['CSAT Score'],
+        x=months,
+        y=csat_scores,
         name='CSAT Score',
         line=dict(color='#0A2540', width=3)
     ))
     
     fig.add_trace(go.Scatter(
-        x=satisfaction_df['Date'],
-        y=satisfaction_df['NPS'],
+        x=months,
+        y=nps_scores,
         name='NPS',
         line=dict(color='#00A67E', width=3),
         yaxis='y2'
@@ -882,107 +918,40 @@ def render_satisfaction_analysis_tab():
         height=400
     )
     
-    st.plotly_chart(fig, use_container_width=True)
+    # Example sentiment data, in _SENTIMENT_COLORS order
+    sentiment_counts = rng.integers([50, 20, 10], [200, 100, 50], endpoint=True)
     
-    # Customer feedback sentiment analysis
-    st.subheader("Feedback Sentiment Analysis")
+    # Create donut chart straight from the counts
+    fig2 = go.Figure(go.Pie(
+        labels=list(_SENTIMENT_COLORS),
+        values=sentiment_counts,
+        hole=0.6,
+        marker=dict(colors=list(_SENTIMENT_COLORS.values())),
+        textposition='inside',
+        textinfo='percent'
+    ))
     
-    # Example sentiment data
-    sentiments = ['Positive', 'Neutral', 'Negative']
-    sentiment_counts = [random.randint(50, 200), random.randint(20, 100), random.randint(10, 50)]
+    fig2.update_layout(
+        height=300,
+        showlegend=True
+    )
     
-    # Calculate percentages
-    total_sentiments = sum(sentiment_counts)
-    sentiment_percentages = [count * 100 / total_sentiments for count in sentiment_counts]
+    # Topic-based sentiment analysis
+    topics = ['Pricing', 'Features', 'Usability', 'Performance', 'Support']
     
-    # Create DataFrame
-    sentiment_df = pd.DataFrame({
-        'Sentiment': sentiments,
-        'Count': sentiment_counts,
-        'Percentage': sentiment_percentages
-    })
+    # Generate random sentiment counts for each topic
+    counts = rng.integers([10, 5, 1], [100, 50, 30], size=(len(topics), 3), endpoint=True)
     
-    col1, col2 = st.columns([1, 2])
+    # Share of each sentiment per topic, one column per sentiment in _SENTIMENT_COLORS order
+    percentages = _row_percentages(counts)
     
-    with col1:
-        # Create donut chart
-        fig2 = px.pie(
-            sentiment_df,
-            values='Count',
-            names='Sentiment',
-            hole=0.6,
-            color='Sentiment',
-            color_discrete_map={
-                'Positive': '#00A67E',
-                'Neutral': '#FFD93D',
-                'Negative': '#FF6B6B'
-            }
-        )
-        
-        fig2.update_traces(textposition='inside', textinfo='percent')
-        
-        fig2.update_layout(
-            height=300,
-            showlegend=True
-        )
-        
-        st.plotly_chart(fig2, use_container_width=True)
-    
-    with col2:
-        # Topic-based sentiment analysis
-        topics = ['Pricing', 'Features', 'Usability', 'Performance', 'Support']
-        
-        # Generate random sentiment counts for each topic
-        topic_sentiment_data = []
-        
-        for topic in topics:
-            pos = random.randint(10, 100)
-            neu = random.randint(5, 50)
-            neg = random.randint(1, 30)
-            total = pos + neu + neg
-            
-            topic_sentiment_data.append({
-                'Topic': topic,
-                'Positive': pos,
-                'Neutral': neu,
-                'Negative': neg,
-                'Positive %': pos * 100 / total,
-                'Neutral %': neu * 100 / total,
-                'Negative %': neg * 100 / total
-            })
-        
-        # Create DataFrame
-        topic_df = pd.DataFrame(topic_sentiment_data)
-        
-        # Create stacked bar chart
-        fig3 = go.Figure()
-        
-        fig3.add_trace(go.Bar(
-            y=topic_df['Topic'],
-            x=topic_df['Positive %'],
-            name='Positive',
-            orientation='h',
-            marker_color='#00A67E'
-        ))
-        
-        fig3.add_trace(go.Bar(
-            y=topic_df['Topic'],
-            x=topic_df['Neutral %'],
-            name='Neutral',
-            orientation='h',
-            marker_color='#FFD93D'
-        ))
-        
-        fig3.add_trace(go.Bar(
-            y=topic_df['Topic'],
-            x=topic_df['Negative %'],
-            name='Negative',
-            orientation='h',
-            marker_color='#FF6B6B'
-        ))
-        
-        # Update layout
-        fig3.update_layout(
+    # Create stacked bar chart, building all three traces and the layout in one constructor call
+    fig3 = go.Figure(
+        data=[
+            go.Bar(y=topics, x=pct, name=sentiment, orientation='h', marker_color=color)
+            for (sentiment, color), pct in zip(_SENTIMENT_COLORS.items(), percentages.T)
+        ],
+        layout=dict(
             title='Sentiment by Topic',
             xaxis=dict(title='Percentage (%)'),
             yaxis=dict(title=''),
@@ -990,24 +959,6 @@ def render_satisfaction_analysis_tab():
             legend=dict(orientation='h', yanchor='bottom', y=1.02, xanchor='right', x=1),
             height=300
         )
-        
-        st.plotly_chart(fig3, use_container_width=True)
-    
-    # Common feedback themes
-    st.subheader("Common Feedback Themes")
-    
-    # Example feedback themes
-    positive_themes = ["Easy to use interface", "Great customer support", "Time-saving features", "Reliable performance"]
-    negative_themes = ["Missing advanced features", "Price is too high", "Learning curve is steep", "Limited integrations"]
-    
-    col3, col4 = st.columns(2)
-    
-    with col3:
-        st.markdown("### Positive Themes")
-        for i, theme in enumerate(positive_themes):
-            st.markdown(f"**{i+1}.** {theme}")
+    )
     
-    with col4:
-        st.markdown("### Areas for Improvement")
-        for i, theme in enumerate(negative_themes):
-            st.markdown(f"**{i+1}.** {theme}")
+    return fig, fig2, fig3
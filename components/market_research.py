@@ -1,9 +1,49 @@
 import streamlit as st
-import plotly.express as px
 import plotly.graph_objects as go
-import pandas as pd
-import random
+import plotly.io as pio
+import numpy as np
 from datetime import datetime, timedelta
+from backend.utils import builder_rng, last_assistant_message, research_seed
+
+# Example competitors, regions and maturity stages, with the palette shared by the competitor charts
+_COMPETITORS = ('Company A', 'Company B', 'Company C', 'Company D', 'Company E', 'Others')
+_COMPETITOR_PALETTE = ('#0A2540', '#00A67E', '#FF6B6B', '#FFD93D', '#6082B6', '#A9A9A9')
+_REGIONS = np.array(['North America', 'Europe', 'Asia Pacific', 'Latin America', 'Middle East & Africa'])
+_MATURITY_STAGES = ("Early", "Growth", "Mature", "Declining")
+
+# Registered under its own name and layered over the stock plotly template, so other pages keep their defaults;
+# traces without an explicit colour take the next palette entry, and every chart shares one height
+pio.templates['research_ninja'] = go.layout.Template(layout=dict(colorway=_COMPETITOR_PALETTE, height=400))
+_TEMPLATE = 'plotly+research_ninja'
+
+# The charts take their colours from the template above, so they skip Streamlit's theme merge and hide the mode bar
+_PLOTLY_CONFIG = {'displayModeBar': False}
+
+# Static chart layouts, built once at import and applied to each freshly built figure
+_MARKET_SIZE_LAYOUT = dict(
+    template=_TEMPLATE,
+    title='Market Size and Growth Rate',
+    xaxis=dict(title='Year'),
+    yaxis=dict(title='Market Size (USD Billions)', side='left'),
+    yaxis2=dict(title='Growth Rate (%)', side='right', overlaying='y', showgrid=False),
+    legend=dict(x=0.01, y=0.99),
+    hovermode='x unified',
+    barmode='group'
+)
+
+_POSITIONING_LAYOUT = dict(
+    template=_TEMPLATE,
+    xaxis=dict(title='Price Positioning (Lower → Higher)'),
+    yaxis=dict(title='Quality/Features (Lower → Higher)')
+)
+
+_REGIONAL_LAYOUT = dict(
+    template=_TEMPLATE,
+    title='Regional Market Distribution and Growth',
+    xaxis=dict(title='Market Share (%)'),
+    yaxis=dict(title='Region'),
+    legend=dict(orientation='h', yanchor='bottom', y=1.02, xanchor='right', x=1)
+)
 
 def render_market_research():
     """Renders the market research visualization panel"""
@@ -18,75 +58,90 @@ def render_market_research():
     # Create columns for metrics
     col1, col2, col3, col4 = st.columns(4)
     
-    # Generate random metrics for demonstration
+    # The metrics and tab data derive from the current research, so reruns show the same values;
+    # each draws from its own tagged stream so they are independent of one another
+    seed = research_seed(st.session_state.chat_history)
+    rng = builder_rng(seed, "metrics")
+    
+    # Generate random metrics for demonstration, drawing them all in one batch
     # In a real application, these would be derived from the research results
+    market_size, key_players, maturity_index = rng.integers([10, 3, 0], [500, 12, len(_MATURITY_STAGES) - 1], endpoint=True)
+    size_delta, cagr, cagr_delta = rng.uniform([-5, 1, -2], [15, 20, 5])
+    
     with col1:
         st.metric(
             label="Market Size",
-            value=f"${random.randint(10, 500)}B",
-            delta=f"{random.uniform(-5, 15):.1f}%"
+            value=f"${market_size}B",
+            delta=f"{size_delta:.1f}%"
         )
     
     with col2:
         st.metric(
             label="CAGR",
-            value=f"{random.uniform(1, 20):.1f}%",
-            delta=f"{random.uniform(-2, 5):.1f}%"
+            value=f"{cagr:.1f}%",
+            delta=f"{cagr_delta:.1f}%"
         )
     
     with col3:
         st.metric(
             label="Key Players",
-            value=f"{random.randint(3, 12)}",
+            value=f"{key_players}",
             delta=None
         )
     
     with col4:
         st.metric(
             label="Market Maturity",
-            value=random.choice(["Early", "Growth", "Mature", "Declining"]),
+            value=_MATURITY_STAGES[maturity_index],
             delta=None
         )
     
-    # Create tabs for different visualizations
-    tab1, tab2, tab3 = st.tabs(["Market Size", "Competitive Landscape", "Regional Analysis"])
-    
-    with tab1:
-        render_market_size_tab()
-    
-    with tab2:
-        render_competitive_landscape_tab()
-    
-    with tab3:
-        render_regional_analysis_tab()
+    # Show one visualization at a time, so only the selected one is built
+    _render_market_view(seed)
     
     # Summary box at the bottom
     st.subheader("Market Summary")
     
     # Extract the last assistant message for the summary
-    assistant_messages = [msg for msg in st.session_state.chat_history if msg["role"] == "assistant"]
+    last_assistant = last_assistant_message(st.session_state.chat_history)
     
-    if assistant_messages:
-        last_message = assistant_messages[-1]["content"]
-        # Take first paragraph as summary
-        summary = last_message.split('\n\n')[0] if '\n\n' in last_message else last_message
+    if last_assistant:
+        # Take first paragraph as summary, stopping at the first paragraph break
+        summary, _, _ = last_assistant["content"].partition('\n\n')
         st.write(summary)
     else:
         st.write("No market research summary available yet. Ask a question to generate insights.")
 
-def render_market_size_tab():
+@st.fragment
+def _render_market_view(seed):
+    """Renders only the selected view, so switching views reruns just this fragment"""
+    view = st.radio(
+        "View",
+        ["Market Size", "Competitive Landscape", "Regional Analysis"],
+        horizontal=True,
+        label_visibility="collapsed",
+        key="market_view"
+    )
+    
+    if view == "Market Size":
+        render_market_size_tab(seed)
+    elif view == "Competitive Landscape":
+        render_competitive_landscape_tab(seed)
+    else:
+        render_regional_analysis_tab(seed)
+
+def render_market_size_tab(seed):
     """Renders the market size visualization tab"""
     st.subheader("Market Size & Growth")
     
-    # Create example market size data
-    # In a real application, this would be derived from the research results
-    current_year = datetime.now().year
-    years = list(range(current_year - 4, current_year + 5))
+    fig = _build_market_size_fig(seed, datetime.now().year)
     
-    # Generate random market size data with a growth trend
-    base_size = random.uniform(50, 200)
-    growth_rate = random.uniform(0.05, 0.15)
-    market_sizes = [base_size * ((1 + growth_rate) ** (i - 4)) for i in range(9)]
+    st.plotly_chart(fig, use_container_width=True, theme=None, config=_PLOTLY_CONFIG)
+
+@st.cache_data(ttl=3600, max_entries=32)
+def _build_market_size_fig(seed, current_year):
+    """Builds the market size and growth rate chart for the research seed"""
+    years, market_sizes, growth_rates = _market_size_data(seed, current_year)
     
     # Create historical vs forecast split
     historical = market_sizes[:5]
@@ -94,167 +149,176 @@ def render_market_size_tab():
     historical_years = years[:5]
     forecast_years = years[4:]
     
-    # Create and display chart
-    fig = go.Figure()
-    
-    # Historical data
-    fig.add_trace(go.Bar(
-        x=historical_years,
-        y=historical,
-        name='Historical',
-        marker_color='#0A2540'
-    ))
-    
-    # Forecast data
-    fig.add_trace(go.Bar(
-        x=forecast_years,
-        y=forecast,
-        name='Forecast',
-        marker_color='#00A67E'
-    ))
-    
-    # Add growth rate line
-    growth_rates = [(market_sizes[i] / market_sizes[i-1] - 1) * 100 for i in range(1, len(market_sizes))]
-    # Add a placeholder for the first year
-    growth_rates.insert(0, None)
-    
-    fig.add_trace(go.Scatter(
-        x=years,
-        y=growth_rates,
-        mode='lines+markers',
-        name='Growth Rate (%)',
-        yaxis='y2',
-        line=dict(color='#FF6B6B', width=2)
-    ))
-    
-    # Update layout for dual-axis chart
-    fig.update_layout(
-        title='Market Size and Growth Rate',
-        xaxis=dict(title='Year'),
-        yaxis=dict(title='Market Size (USD Billions)', side='left'),
-        yaxis2=dict(title='Growth Rate (%)', side='right', overlaying='y', showgrid=False),
-        legend=dict(x=0.01, y=0.99),
-        hovermode='x unified',
-        barmode='group',
-        height=400
+    # Create the bars and growth line in one constructor call, applying the dual-axis layout
+    fig = go.Figure(
+        data=[
+            # Historical data
+            go.Bar(
+                x=historical_years,
+                y=historical,
+                name='Historical'
+            ),
+            # Forecast data
+            go.Bar(
+                x=forecast_years,
+                y=forecast,
+                name='Forecast'
+            ),
+            # Growth rate line
+            go.Scatter(
+                x=years,
+                y=growth_rates,
+                mode='lines+markers',
+                name='Growth Rate (%)',
+                yaxis='y2',
+                line=dict(width=2)
+            )
+        ],
+        layout=_MARKET_SIZE_LAYOUT
     )
     
-    st.plotly_chart(fig, use_container_width=True)
+    return fig
 
-def render_competitive_landscape_tab():
-    """Renders the competitive landscape visualization tab"""
-    st.subheader("Competitive Landscape")
+@st.cache_data(ttl=3600, max_entries=32)
+def _market_size_data(seed, current_year):
+    """Generates the example market size series and its year-on-year growth for the research seed"""
+    rng = builder_rng(seed, "market_size")
     
-    # Create example competitor data
+    # Create example market size data
     # In a real application, this would be derived from the research results
-    competitors = ['Company A', 'Company B', 'Company C', 'Company D', 'Company E', 'Others']
-    market_share = [random.uniform(5, 25) for _ in range(5)]
-    market_share.append(100 - sum(market_share))  # Others make up the remaining percentage
-    
-    # Create and display pie chart
-    fig = px.pie(
-        values=market_share,
-        names=competitors,
-        title='Market Share Distribution',
-        color_discrete_sequence=['#0A2540', '#00A67E', '#FF6B6B', '#FFD93D', '#6082B6', '#A9A9A9']
-    )
+    years = list(range(current_year - 4, current_year + 5))
     
-    fig.update_traces(textposition='inside', textinfo='percent+label')
+    # Generate random market size data with a growth trend
+    base_size, growth_rate = rng.uniform([50, 0.05], [200, 0.15])
+    market_sizes = base_size * (1 + growth_rate) ** np.arange(-4, 5)
+    
+    # Year-on-year growth, with a NaN placeholder for the first year
+    growth_rates = np.insert(np.diff(market_sizes) / market_sizes[:-1] * 100, 0, np.nan)
+    
+    return years, market_sizes, growth_rates
+
+def render_competitive_landscape_tab(seed):
+    """Renders the competitive landscape visualization tab"""
+    st.subheader("Competitive Landscape")
+    
+    share_fig, positioning_fig = _build_competitor_figs(seed)
     
-    st.plotly_chart(fig, use_container_width=True)
+    st.plotly_chart(share_fig, use_container_width=True, theme=None, config=_PLOTLY_CONFIG)
     
     # Create a competitive positioning map
     st.subheader("Competitor Positioning")
     
-    # Create example positioning data
-    price_positioning = [random.uniform(1, 10) for _ in range(5)]
-    quality_positioning = [random.uniform(1, 10) for _ in range(5)]
-    revenue = [random.uniform(1, 15) for _ in range(5)]
-    
-    # Create a DataFrame for the scatter plot
-    df = pd.DataFrame({
-        'Competitor': competitors[:5],  # Exclude "Others"
-        'Price Point': price_positioning,
-        'Quality/Features': quality_positioning,
-        'Revenue (USD Billions)': revenue
-    })
-    
-    # Create and display scatter plot
-    fig = px.scatter(
-        df,
-        x='Price Point',
-        y='Quality/Features',
-        size='Revenue (USD Billions)',
-        color='Competitor',
-        text='Competitor',
-        size_max=50,
-        title='Competitive Positioning Map',
-        color_discrete_sequence=['#0A2540', '#00A67E', '#FF6B6B', '#FFD93D', '#6082B6']
+    st.plotly_chart(positioning_fig, use_container_width=True, theme=None, config=_PLOTLY_CONFIG)
+
+@st.cache_data(ttl=3600, max_entries=32)
+def _build_competitor_figs(seed):
+    """Builds the market share pie and the competitor positioning map for the research seed"""
+    market_share, price_positioning, quality_positioning, revenue = _competitor_data(seed)
+    
+    # Create pie chart
+    share_fig = go.Figure(
+        go.Pie(
+            labels=_COMPETITORS,
+            values=market_share,
+            marker=dict(colors=_COMPETITOR_PALETTE),
+            textposition='inside',
+            textinfo='percent+label'
+        ),
+        layout=dict(template=_TEMPLATE, title='Market Share Distribution')
     )
     
-    fig.update_layout(
-        xaxis=dict(title='Price Positioning (Lower → Higher)'),
-        yaxis=dict(title='Quality/Features (Lower → Higher)'),
-        height=400
+    # Create scatter plot as a single labelled trace, colouring each competitor from the palette and
+    # scaling marker areas so the largest is 50px across
+    positioning_fig = go.Figure(
+        go.Scatter(
+            x=price_positioning,
+            y=quality_positioning,
+            mode='markers+text',
+            text=_COMPETITORS[:5],  # Exclude "Others"
+            marker=dict(
+                size=revenue,
+                color=_COMPETITOR_PALETTE[:5],
+                sizemode='area',
+                sizeref=2 * revenue.max() / 50 ** 2
+            )
+        ),
+        layout=dict(title='Competitive Positioning Map')
     )
     
-    st.plotly_chart(fig, use_container_width=True)
+    positioning_fig.update_layout(**_POSITIONING_LAYOUT)
+    
+    return share_fig, positioning_fig
 
-def render_regional_analysis_tab():
+@st.cache_data(ttl=3600, max_entries=32)
+def _competitor_data(seed):
+    """Generates the example market shares and competitor positioning series for the research seed"""
+    rng = builder_rng(seed, "competitors")
+    
+    # Create example competitor data
+    # In a real application, this would be derived from the research results
+    market_share = rng.uniform(5, 25, 5)
+    market_share = np.append(market_share, 100 - market_share.sum())  # Others make up the remaining percentage
+    
+    # Create example positioning data, one row each for price, quality and revenue
+    price_positioning, quality_positioning, revenue = rng.uniform([[1], [1], [1]], [[10], [10], [15]], size=(3, 5))
+    
+    return market_share, price_positioning, quality_positioning, revenue
+
+def render_regional_analysis_tab(seed):
     """Renders the regional analysis visualization tab"""
     st.subheader("Regional Market Distribution")
     
+    fig = _build_regional_fig(seed)
+    
+    st.plotly_chart(fig, use_container_width=True, theme=None, config=_PLOTLY_CONFIG)
+
+@st.cache_data(ttl=3600, max_entries=32)
+def _build_regional_fig(seed):
+    """Builds the regional share and growth chart for the research seed"""
+    regions, market_share, growth_rate = _regional_data(seed)
+    
+    # Create horizontal bar chart with growth rate markers in one constructor call
+    fig = go.Figure(
+        data=[
+            go.Bar(
+                y=regions,
+                x=market_share,
+                orientation='h',
+                name='Market Share (%)'
+            ),
+            # WebGL markers keep browser rendering cheap if real data brings many more regions
+            go.Scattergl(
+                y=regions,
+                x=growth_rate,
+                mode='markers',
+                marker=dict(
+                    size=12,
+                    color=growth_rate,
+                    colorscale='RdYlGn',
+                    colorbar=dict(title='Growth Rate (%)'),
+                    cmin=-5,
+                    cmax=15,
+                    line=dict(width=1, color='black')
+                ),
+                name='Growth Rate (%)'
+            )
+        ],
+        layout=_REGIONAL_LAYOUT
+    )
+    
+    return fig
+
+@st.cache_data(ttl=3600, max_entries=32)
+def _regional_data(seed):
+    """Generates the example regional shares and growth rates for the research seed, sorted by share"""
+    rng = builder_rng(seed, "regional")
+    
     # Create example regional data
     # In a real application, this would be derived from the research results
-    regions = ['North America', 'Europe', 'Asia Pacific', 'Latin America', 'Middle East & Africa']
-    market_share = [random.uniform(5, 40) for _ in range(len(regions))]
-    market_share = [share * 100 / sum(market_share) for share in market_share]  # Normalize to 100%
-    growth_rate = [random.uniform(-2, 15) for _ in range(len(regions))]
-    
-    # Create a DataFrame for the visualization
-    df = pd.DataFrame({
-        'Region': regions,
-        'Market Share (%)': market_share,
-        'Growth Rate (%)': growth_rate
-    })
-    
-    # Sort by market share
-    df = df.sort_values('Market Share (%)', ascending=False)
-    
-    # Create and display horizontal bar chart
-    fig = go.Figure()
-    
-    fig.add_trace(go.Bar(
-        y=df['Region'],
-        x=df['Market Share (%)'],
-        orientation='h',
-        marker_color='#0A2540',
-        name='Market Share (%)'
-    ))
-    
-    # Add growth rate markers
-    fig.add_trace(go.Scatter(
-        y=df['Region'],
-        x=df['Growth Rate (%)'],
-        mode='markers',
-        marker=dict(
-            size=12,
-            color=df['Growth Rate (%)'],
-            colorscale='RdYlGn',
-            colorbar=dict(title='Growth Rate (%)'),
-            cmin=-5,
-            cmax=15,
-            line=dict(width=1, color='black')
-        ),
-        name='Growth Rate (%)'
-    ))
-    
-    fig.update_layout(
-        title='Regional Market Distribution and Growth',
-        xaxis=dict(title='Market Share (%)'),
-        yaxis=dict(title='Region'),
-        height=400,
-        legend=dict(orientation='h', yanchor='bottom', y=1.02, xanchor='right', x=1)
-    )
+    market_share = rng.uniform(5, 40, len(_REGIONS))
+    market_share *= 100 / market_share.sum()  # Normalize to 100%
+    growth_rate = rng.uniform(-2, 15, len(_REGIONS))
     
-    st.plotly_chart(fig, use_container_width=True)
+    # Sort all three series by market share, largest first
+    order = np.argsort(-market_share)
+    return _REGIONS[order], market_share[order], growth_rate[order]